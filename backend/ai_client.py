@@ -19,6 +19,11 @@ MARKDOWN_LINK_PATTERN = re.compile(r"\[.*?\]\(.*?\)")
 MARKDOWN_SYMBOL_PATTERN = re.compile(r"[#*_\-\[\](){}|>]")
 WHITESPACE_PATTERN = re.compile(r"\s+")
 HAN_CHAR_PATTERN = re.compile(r"[\u4e00-\u9fff]")
+# 语言判断只需前部样本；限制扫描窗口，避免对整篇长 HTML 逐个执行清洗正则
+LANGUAGE_DETECTION_SAMPLE_CHARS = 32768
+NON_LETTER_ASCII_BYTES = bytes(
+    byte for byte in range(128) if not chr(byte).isalpha()
+)
 
 
 def is_english_content(text: str, threshold: float = 0.7) -> bool:
@@ -35,7 +40,7 @@ def is_english_content(text: str, threshold: float = 0.7) -> bool:
     if not text:
         return False
 
-    clean_text = text
+    clean_text = text[:LANGUAGE_DETECTION_SAMPLE_CHARS]
     clean_text = FENCED_CODE_PATTERN.sub("", clean_text)
     clean_text = INLINE_CODE_PATTERN.sub("", clean_text)
     clean_text = URL_PATTERN.sub("", clean_text)
@@ -50,21 +55,25 @@ def is_english_content(text: str, threshold: float = 0.7) -> bool:
         return False
 
     # Count ASCII letters (a-z, A-Z) vs non-ASCII characters
-    ascii_letters = sum(1 for c in clean_text if c.isascii() and c.isalpha())
-    non_ascii_letters = sum(1 for c in clean_text if not c.isascii() and c.isalpha())
-
-    total_letters = ascii_letters + non_ascii_letters
+    # 在字节层面用 translate 统计 ASCII 字母，纯 ASCII 文本跳过逐字符与汉字扫描
+    ascii_letters = len(
+        clean_text.encode("ascii", "ignore").translate(None, NON_LETTER_ASCII_BYTES)
+    )
+    is_ascii_text = clean_text.isascii()
+    total_letters = ascii_letters if is_ascii_text else sum(map(str.isalpha, clean_text))
     if total_letters == 0:
         return False
     if total_letters < 40:
         return False
 
     ascii_ratio = ascii_letters / total_letters
+    if ascii_ratio < threshold:
+        return False
+    if is_ascii_text:
+        return True
     han_chars = len(HAN_CHAR_PATTERN.findall(clean_text))
     han_ratio = han_chars / total_letters
-    if han_ratio >= 0.2:
-        return False
-    return ascii_ratio >= threshold
+    return han_ratio < 0.2
 
 
 class ConfigurableAIClient:
@@ -6,7 +6,7 @@ from logging.config import fileConfig
 from pathlib import Path
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, event, pool
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
@@ -33,6 +33,18 @@ def get_database_url() -> str:
     )
 
 
+def enable_sqlite_transactional_ddl(connectable) -> None:
+    # pysqlite 不会为 DDL 隐式开启事务，每条 CREATE/ALTER 会单独提交；
+    # 接管事务控制并显式 BEGIN，使整次升级在一个事务内完成、只提交一次。
+    @event.listens_for(connectable, "connect")
+    def _disable_pysqlite_transaction_handling(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(connectable, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
 def run_migrations_offline() -> None:
     url = get_database_url()
     context.configure(
@@ -62,12 +74,18 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
         connect_args=connect_args,
     )
+    is_sqlite = url.startswith("sqlite")
+    if is_sqlite:
+        enable_sqlite_transactional_ddl(connectable)
 
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            # SQLiteImpl 默认按非事务 DDL 处理并在每个 revision 后提交；
+            # 显式 BEGIN 生效后声明为事务 DDL，整次升级失败时全部回滚。
+            transactional_ddl=True if is_sqlite else None,
         )
 
         with context.begin_transaction():
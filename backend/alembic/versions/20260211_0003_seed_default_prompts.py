@@ -12,6 +12,7 @@ from datetime import date
 import uuid
 
 from alembic import op
+import sqlalchemy as sa
 from sqlalchemy import text
 
 # revision identifiers, used by Alembic.
@@ -21,7 +22,7 @@ branch_labels = None
 depends_on = None
 
 
-DEFAULT_PROMPT_CONFIGS = [
+DEFAULT_PROMPT_CONFIGS = (
     {
         "name": "默认-快读摘要",
         "type": "summary",
@@ -213,45 +214,26 @@ HTML：
         "max_tokens": 12000,
         "top_p": 1.0,
     },
-]
+)
 
 
-INSERT_SQL = text(
-    """
-    INSERT INTO prompt_configs (
-        id,
-        name,
-        category_id,
-        type,
-        prompt,
-        system_prompt,
-        response_format,
-        temperature,
-        max_tokens,
-        top_p,
-        model_api_config_id,
-        is_enabled,
-        is_default,
-        created_at,
-        updated_at
-    ) VALUES (
-        :id,
-        :name,
-        NULL,
-        :type,
-        :prompt,
-        :system_prompt,
-        :response_format,
-        :temperature,
-        :max_tokens,
-        :top_p,
-        NULL,
-        1,
-        1,
-        :created_at,
-        :updated_at
-    )
-    """
+PROMPT_CONFIGS_TABLE = sa.table(
+    "prompt_configs",
+    sa.column("id", sa.String),
+    sa.column("name", sa.String),
+    sa.column("category_id", sa.String),
+    sa.column("type", sa.String),
+    sa.column("prompt", sa.Text),
+    sa.column("system_prompt", sa.Text),
+    sa.column("response_format", sa.String),
+    sa.column("temperature", sa.Float),
+    sa.column("max_tokens", sa.Integer),
+    sa.column("top_p", sa.Float),
+    sa.column("model_api_config_id", sa.String),
+    sa.column("is_enabled", sa.Boolean),
+    sa.column("is_default", sa.Boolean),
+    sa.column("created_at", sa.String),
+    sa.column("updated_at", sa.String),
 )
 
 
@@ -262,12 +244,13 @@ def upgrade() -> None:
         return
 
     today = date.today().isoformat()
-    for item in DEFAULT_PROMPT_CONFIGS:
-        bind.execute(
-            INSERT_SQL,
+    op.bulk_insert(
+        PROMPT_CONFIGS_TABLE,
+        [
             {
                 "id": str(uuid.uuid4()),
                 "name": item["name"],
+                "category_id": None,
                 "type": item["type"],
                 "prompt": item["prompt"],
                 "system_prompt": item["system_prompt"],
@@ -275,25 +258,32 @@ def upgrade() -> None:
                 "temperature": item["temperature"],
                 "max_tokens": item["max_tokens"],
                 "top_p": item["top_p"],
+                "model_api_config_id": None,
+                "is_enabled": True,
+                "is_default": True,
                 "created_at": today,
                 "updated_at": today,
-            },
-        )
+            }
+            for item in DEFAULT_PROMPT_CONFIGS
+        ],
+    )
+
+
+DELETE_SQL = text(
+    """
+    DELETE FROM prompt_configs
+    WHERE category_id IS NULL
+      AND is_default = 1
+      AND model_api_config_id IS NULL
+      AND type = :type
+      AND name = :name
+    """
+)
 
 
 def downgrade() -> None:
     bind = op.get_bind()
-    for item in DEFAULT_PROMPT_CONFIGS:
-        bind.execute(
-            text(
-                """
-                DELETE FROM prompt_configs
-                WHERE category_id IS NULL
-                  AND is_default = 1
-                  AND model_api_config_id IS NULL
-                  AND type = :type
-                  AND name = :name
-                """
-            ),
-            {"type": item["type"], "name": item["name"]},
-        )
+    bind.execute(
+        DELETE_SQL,
+        [{"type": item["type"], "name": item["name"]} for item in DEFAULT_PROMPT_CONFIGS],
+    )
@@ -170,25 +170,24 @@ PROMPT_UPDATES = [
 ]
 
 
+UPDATE_BUILTIN_PROMPT_SQL = text(
+    """
+    UPDATE prompt_configs
+    SET prompt = :prompt,
+        system_prompt = :system_prompt
+    WHERE type = :type
+      AND name = :name
+      AND category_id IS NULL
+      AND model_api_config_id IS NULL
+      AND prompt = :old_prompt
+      AND COALESCE(system_prompt, '') = COALESCE(:old_system_prompt, '')
+    """
+)
+
+
 def upgrade() -> None:
     conn = op.get_bind()
-    for item in PROMPT_UPDATES:
-        conn.execute(
-            text(
-                """
-                UPDATE prompt_configs
-                SET prompt = :prompt,
-                    system_prompt = :system_prompt
-                WHERE type = :type
-                  AND name = :name
-                  AND category_id IS NULL
-                  AND model_api_config_id IS NULL
-                  AND prompt = :old_prompt
-                  AND COALESCE(system_prompt, '') = COALESCE(:old_system_prompt, '')
-                """
-            ),
-            item,
-        )
+    conn.execute(UPDATE_BUILTIN_PROMPT_SQL, PROMPT_UPDATES)
 
 
 def downgrade() -> None:
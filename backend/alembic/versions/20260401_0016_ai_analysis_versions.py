@@ -52,10 +52,86 @@ CONTENT_TYPE_SPECS = {
 }
 
 
+BACKFILL_BATCH_SIZE = 1000
+
+SELECT_LATEST_VERSION_SQL = sa.text(
+    """
+    SELECT id
+    FROM ai_analysis_versions
+    WHERE article_id = :article_id
+      AND content_type = :content_type
+    ORDER BY version_number DESC
+    LIMIT 1
+    """
+)
+
+INSERT_INITIAL_VERSION_SQL = sa.text(
+    """
+    INSERT INTO ai_analysis_versions (
+        id,
+        article_id,
+        content_type,
+        version_number,
+        status,
+        content_text,
+        content_html,
+        content_image_url,
+        source_task_id,
+        source_model_config_id,
+        source_prompt_config_id,
+        created_by_mode,
+        rollback_from_version_id,
+        created_at
+    )
+    VALUES (
+        :id,
+        :article_id,
+        :content_type,
+        1,
+        'completed',
+        :content_text,
+        :content_html,
+        :content_image_url,
+        NULL,
+        NULL,
+        NULL,
+        'generation',
+        NULL,
+        :created_at
+    )
+    """
+)
+
+UPDATE_POINTER_SQL = {
+    spec["pointer_field"]: sa.text(
+        f"""
+        UPDATE ai_analyses
+        SET {spec["pointer_field"]} = :version_id
+        WHERE id = :analysis_id
+        """
+    )
+    for spec in CONTENT_TYPE_SPECS.values()
+}
+
+
 def _has_renderable_value(value: object | None) -> bool:
     return isinstance(value, str) and bool(value.strip())
 
 
+def _flush_backfill_batch(
+    bind,
+    version_rows: list[dict],
+    pointer_updates: dict[str, list[dict]],
+) -> None:
+    if version_rows:
+        bind.execute(INSERT_INITIAL_VERSION_SQL, version_rows)
+        version_rows.clear()
+    for pointer_field, params in pointer_updates.items():
+        if params:
+            bind.execute(UPDATE_POINTER_SQL[pointer_field], params)
+            params.clear()
+
+
 def _backfill_existing_ai_content_versions(bind) -> None:
     rows = bind.execute(
         sa.text(
@@ -77,9 +153,15 @@ def _backfill_existing_ai_content_versions(bind) -> None:
                 updated_at
             FROM ai_analyses
             """
-        )
+        ).execution_options(yield_per=BACKFILL_BATCH_SIZE)
     ).mappings()
 
+    # 写入按批次 executemany，避免逐行往返；本批尚未落库的版本记在内存里参与去重
+    version_rows: list[dict] = []
+    pointer_updates: dict[str, list[dict]] = {
+        pointer_field: [] for pointer_field in UPDATE_POINTER_SQL
+    }
+    pending_version_ids: dict[tuple[str, str], str] = {}
     for row in rows:
         article_id = row.get("article_id")
         if not article_id:
@@ -110,78 +192,29 @@ def _backfill_existing_ai_content_versions(bind) -> None:
             if not has_content:
                 continue
 
-            existing_version = bind.execute(
-                sa.text(
-                    """
-                    SELECT id
-                    FROM ai_analysis_versions
-                    WHERE article_id = :article_id
-                      AND content_type = :content_type
-                    ORDER BY version_number DESC
-                    LIMIT 1
-                    """
-                ),
-                {
-                    "article_id": article_id,
-                    "content_type": content_type,
-                },
-            ).mappings().first()
+            existing_version_id = pending_version_ids.get((article_id, content_type))
+            if existing_version_id is None:
+                existing_version_id = bind.execute(
+                    SELECT_LATEST_VERSION_SQL,
+                    {
+                        "article_id": article_id,
+                        "content_type": content_type,
+                    },
+                ).scalar()
 
-            if existing_version:
+            if existing_version_id:
                 if not current_version_id:
-                    bind.execute(
-                        sa.text(
-                            f"""
-                            UPDATE ai_analyses
-                            SET {pointer_field} = :version_id
-                            WHERE id = :analysis_id
-                            """
-                        ),
+                    pointer_updates[pointer_field].append(
                         {
-                            "version_id": existing_version["id"],
+                            "version_id": existing_version_id,
                             "analysis_id": row["id"],
-                        },
+                        }
                     )
                 continue
 
             new_version_id = str(uuid.uuid4())
-            bind.execute(
-                sa.text(
-                    """
-                    INSERT INTO ai_analysis_versions (
-                        id,
-                        article_id,
-                        content_type,
-                        version_number,
-                        status,
-                        content_text,
-                        content_html,
-                        content_image_url,
-                        source_task_id,
-                        source_model_config_id,
-                        source_prompt_config_id,
-                        created_by_mode,
-                        rollback_from_version_id,
-                        created_at
-                    )
-                    VALUES (
-                        :id,
-                        :article_id,
-                        :content_type,
-                        1,
-                        'completed',
-                        :content_text,
-                        :content_html,
-                        :content_image_url,
-                        NULL,
-                        NULL,
-                        NULL,
-                        'generation',
-                        NULL,
-                        :created_at
-                    )
-                    """
-                ),
+            pending_version_ids[(article_id, content_type)] = new_version_id
+            version_rows.append(
                 {
                     "id": new_version_id,
                     "article_id": article_id,
@@ -190,22 +223,21 @@ def _backfill_existing_ai_content_versions(bind) -> None:
                     "content_html": content_html,
                     "content_image_url": content_image_url,
                     "created_at": row.get("updated_at"),
-                },
+                }
             )
-            bind.execute(
-                sa.text(
-                    f"""
-                    UPDATE ai_analyses
-                    SET {pointer_field} = :version_id
-                    WHERE id = :analysis_id
-                    """
-                ),
+            pointer_updates[pointer_field].append(
                 {
                     "version_id": new_version_id,
                     "analysis_id": row["id"],
-                },
+                }
             )
 
+        if len(version_rows) >= BACKFILL_BATCH_SIZE:
+            _flush_backfill_batch(bind, version_rows, pointer_updates)
+            pending_version_ids.clear()
+
+    _flush_backfill_batch(bind, version_rows, pointer_updates)
+
 
 def upgrade() -> None:
     bind = op.get_bind()
@@ -0,0 +1,70 @@
+"""store article embedding source hash as binary digest
+
+Revision ID: 20261017_0019
+Revises: 20260410_0018
+Create Date: 2026-10-17 10:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect, text
+
+
+revision = "20261017_0019"
+down_revision = "20260410_0018"
+branch_labels = None
+depends_on = None
+
+
+def _source_hash_type(inspector: sa.Inspector) -> sa.types.TypeEngine | None:
+    if "article_embeddings" not in set(inspector.get_table_names()):
+        return None
+    for column in inspector.get_columns("article_embeddings"):
+        if column["name"] == "source_hash":
+            return column["type"]
+    return None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    column_type = _source_hash_type(inspect(bind))
+    if column_type is None:
+        return
+
+    if not isinstance(column_type, sa.LargeBinary):
+        # 旧值为 sha256 十六进制串，与新的 blake2b 摘要不兼容，清空后按需重建向量。
+        bind.execute(text("UPDATE article_embeddings SET source_hash = NULL"))
+        with op.batch_alter_table("article_embeddings") as batch_op:
+            batch_op.alter_column(
+                "source_hash",
+                existing_type=sa.String(),
+                type_=sa.LargeBinary(16),
+                existing_nullable=True,
+            )
+
+    op.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_article_embeddings_source_hash "
+            "ON article_embeddings (source_hash)"
+        )
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    column_type = _source_hash_type(inspect(bind))
+    if column_type is None:
+        return
+
+    op.execute(text("DROP INDEX IF EXISTS idx_article_embeddings_source_hash"))
+    if isinstance(column_type, sa.LargeBinary):
+        bind.execute(text("UPDATE article_embeddings SET source_hash = NULL"))
+        with op.batch_alter_table("article_embeddings") as batch_op:
+            batch_op.alter_column(
+                "source_hash",
+                existing_type=sa.LargeBinary(16),
+                type_=sa.String(),
+                existing_nullable=True,
+            )
@@ -0,0 +1,103 @@
+"""partial unique index for article source url
+
+Revision ID: 20261017_0020
+Revises: 20261017_0019
+Create Date: 2026-10-17 11:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect, text
+
+
+revision = "20261017_0020"
+down_revision = "20261017_0019"
+branch_labels = None
+depends_on = None
+
+SOURCE_URL_UNIQUE_CONSTRAINT = "uq_articles_source_url"
+NAMING_CONVENTION = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+
+
+def _has_source_url_column(inspector: sa.Inspector) -> bool:
+    if "articles" not in set(inspector.get_table_names()):
+        return False
+    return any(
+        column["name"] == "source_url" for column in inspector.get_columns("articles")
+    )
+
+
+def _has_source_url_unique_constraint(inspector: sa.Inspector) -> bool:
+    return any(
+        constraint.get("column_names") == ["source_url"]
+        for constraint in inspector.get_unique_constraints("articles")
+    )
+
+
+def _capture_article_index_ddl(bind) -> list[tuple[str, str]]:
+    if bind.dialect.name != "sqlite":
+        return []
+    rows = bind.execute(
+        text(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'articles' AND sql IS NOT NULL"
+        )
+    ).fetchall()
+    return [(row[0], row[1]) for row in rows]
+
+
+def _restore_article_index_ddl(index_ddl: list[tuple[str, str]]) -> None:
+    # batch 重建表时反射出的索引会丢失 DESC 排序，按原始 DDL 重新创建。
+    for name, sql in index_ddl:
+        op.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+        op.execute(text(sql))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if not _has_source_url_column(inspector):
+        return
+
+    if _has_source_url_unique_constraint(inspector):
+        # 表级 UNIQUE 约束会把 NULL 行也写入索引，SQLite 只能重建表来移除它。
+        index_ddl = _capture_article_index_ddl(bind)
+        with op.batch_alter_table(
+            "articles", naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(SOURCE_URL_UNIQUE_CONSTRAINT, type_="unique")
+        _restore_article_index_ddl(index_ddl)
+
+    op.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_source_url_unique "
+            "ON articles (source_url) WHERE source_url IS NOT NULL"
+        )
+    )
+    # 部分唯一索引已覆盖 source_url = ? 的等值查询，普通索引只会增加写放大。
+    op.execute(text("DROP INDEX IF EXISTS idx_articles_source_url"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if not _has_source_url_column(inspector):
+        return
+
+    op.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_articles_source_url ON articles(source_url)"
+        )
+    )
+    op.execute(text("DROP INDEX IF EXISTS idx_articles_source_url_unique"))
+    if not _has_source_url_unique_constraint(inspector):
+        index_ddl = _capture_article_index_ddl(bind)
+        with op.batch_alter_table(
+            "articles", naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.create_unique_constraint(
+                SOURCE_URL_UNIQUE_CONSTRAINT, ["source_url"]
+            )
+        _restore_article_index_ddl(index_ddl)
@@ -0,0 +1,34 @@
+"""index article tags by tag id
+
+Revision ID: 20261017_0021
+Revises: 20261017_0020
+Create Date: 2026-10-17 12:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+
+revision = "20261017_0021"
+down_revision = "20261017_0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "article_tags" not in set(inspect(bind).get_table_names()):
+        return
+    # 主键 (article_id, tag_id) 无法服务按 tag_id 的标签计数与孤儿标签清理，补齐反向复合索引。
+    op.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_article_tags_tag_article "
+            "ON article_tags (tag_id, article_id)"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(text("DROP INDEX IF EXISTS idx_article_tags_tag_article"))
@@ -0,0 +1,43 @@
+"""index ai tasks by claim order
+
+Revision ID: 20261017_0022
+Revises: 20261017_0021
+Create Date: 2026-10-17 13:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+
+revision = "20261017_0022"
+down_revision = "20261017_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "ai_tasks" not in set(inspect(bind).get_table_names()):
+        return
+    # claim_task 按 (run_at, created_at) 取最早的 pending 任务，补上 created_at 免去临时排序；旧索引是其前缀。
+    op.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_ai_tasks_status_run_at_created_at "
+            "ON ai_tasks (status, run_at, created_at)"
+        )
+    )
+    op.execute(text("DROP INDEX IF EXISTS idx_ai_tasks_status_run_at"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if "ai_tasks" in set(inspect(bind).get_table_names()):
+        op.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_ai_tasks_status_run_at "
+                "ON ai_tasks (status, run_at)"
+            )
+        )
+    op.execute(text("DROP INDEX IF EXISTS idx_ai_tasks_status_run_at_created_at"))
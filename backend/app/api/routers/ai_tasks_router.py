@@ -1,4 +1,3 @@
-import json
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -12,6 +11,7 @@ from models import (
     AITask,
     AITaskEvent,
     Article,
+    JSONText,
     ModelAPIConfig,
     PromptConfig,
     ReviewIssue,
@@ -34,13 +34,7 @@ def _get_preferred_article_title(article) -> str | None:
 
 
 def _parse_task_payload(task: AITask) -> dict:
-    if not task.payload:
-        return {}
-    try:
-        payload = json.loads(task.payload)
-    except Exception:
-        return {}
-    return payload if isinstance(payload, dict) else {}
+    return dict(task.payload) if isinstance(task.payload, dict) else {}
 
 
 def _resolve_task_target(
@@ -231,7 +225,7 @@ async def get_ai_task(
         "task_type": task.task_type,
         "content_type": task.content_type,
         "status": task.status,
-        "payload": task.payload,
+        "payload": JSONText.dumps(task.payload),
         "attempts": task.attempts,
         "max_attempts": task.max_attempts,
         "run_at": task.run_at,
@@ -289,12 +283,7 @@ async def get_ai_task_timeline(
 
     event_items = []
     for event in events:
-        details = None
-        if event.details:
-            try:
-                details = json.loads(event.details)
-            except Exception:
-                details = event.details
+        details = event.details or None
         event_items.append(
             {
                 "id": event.id,
@@ -392,20 +381,6 @@ async def retry_ai_tasks(
             return task.content_type
         return None
 
-    def parse_task_payload(task: AITask) -> dict:
-        if not task.payload:
-            return {}
-        try:
-            payload = json.loads(task.payload)
-        except Exception:
-            return {}
-        return payload if isinstance(payload, dict) else {}
-
-    def serialize_payload(payload: dict) -> str:
-        return json.dumps(
-            payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
-        )
-
     task_ids = list(dict.fromkeys(request.task_ids))
     tasks = db.query(AITask).filter(AITask.id.in_(task_ids)).all()
     task_map = {task.id: task for task in tasks}
@@ -443,28 +418,43 @@ async def retry_ai_tasks(
     skipped_ids: list[str] = []
     skipped_reasons: dict[str, str] = {}
 
-    def find_active_duplicate(task: AITask, payload_json: str) -> str | None:
-        duplicate_query = db.query(AITask.id).filter(
-            AITask.id != task.id,
-            AITask.status.in_(["pending", "processing"]),
-            AITask.task_type == task.task_type,
-        )
-        if task.article_id is None:
-            duplicate_query = duplicate_query.filter(AITask.article_id.is_(None))
-        else:
-            duplicate_query = duplicate_query.filter(AITask.article_id == task.article_id)
-
-        if task.content_type is None:
-            duplicate_query = duplicate_query.filter(AITask.content_type.is_(None))
-        else:
-            duplicate_query = duplicate_query.filter(AITask.content_type == task.content_type)
-
-        duplicate_query = duplicate_query.filter(AITask.payload == payload_json)
-
-        duplicate = (
-            duplicate_query.order_by(AITask.created_at.desc(), AITask.id.desc()).first()
+    def build_dedupe_key(
+        article_id: str | None,
+        task_type: str,
+        content_type: str | None,
+        payload: dict | None,
+    ) -> tuple:
+        return (article_id, task_type, content_type, JSONText.dumps(payload or {}))
+
+    # 一次性预取相关类型的活跃任务，在内存中按去重键查重，避免逐条任务查询；
+    # 本批已重试的任务也登记进去，防止同一批内互为重复的任务同时回到 pending
+    active_ids_by_key: dict[tuple, list[str]] = {}
+    if tasks:
+        active_rows = (
+            db.query(
+                AITask.id,
+                AITask.article_id,
+                AITask.task_type,
+                AITask.content_type,
+                AITask.payload,
+            )
+            .filter(
+                AITask.status.in_(["pending", "processing"]),
+                AITask.task_type.in_({task.task_type for task in tasks}),
+            )
+            .order_by(AITask.created_at.desc(), AITask.id.desc())
+            .all()
         )
-        return duplicate.id if duplicate else None
+        for row in active_rows:
+            key = build_dedupe_key(row.article_id, row.task_type, row.content_type, row.payload)
+            active_ids_by_key.setdefault(key, []).append(row.id)
+
+    def find_active_duplicate(task: AITask, payload: dict) -> str | None:
+        key = build_dedupe_key(task.article_id, task.task_type, task.content_type, payload)
+        for active_id in active_ids_by_key.get(key, []):
+            if active_id != task.id:
+                return active_id
+        return None
 
     for task_id in task_ids:
         task = task_map.get(task_id)
@@ -473,7 +463,7 @@ async def retry_ai_tasks(
             skipped_reasons[task_id] = "任务不存在"
             continue
 
-        payload = parse_task_payload(task)
+        payload = _parse_task_payload(task)
 
         if override_prompt_id:
             prompt_type = resolve_prompt_type(task)
@@ -481,16 +471,7 @@ async def retry_ai_tasks(
                 skipped_ids.append(task_id)
                 skipped_reasons[task_id] = "该任务类型不支持提示词覆盖"
                 continue
-            prompt_match = (
-                db.query(PromptConfig.id)
-                .filter(
-                    PromptConfig.id == override_prompt_id,
-                    PromptConfig.is_enabled == True,
-                    PromptConfig.type == prompt_type,
-                )
-                .first()
-            )
-            if not prompt_match:
+            if prompt_config.type != prompt_type:
                 skipped_ids.append(task_id)
                 skipped_reasons[task_id] = "提示词类型与任务不匹配"
                 continue
@@ -499,9 +480,7 @@ async def retry_ai_tasks(
         if override_model_id:
             payload["model_config_id"] = override_model_id
 
-        payload_json = serialize_payload(payload)
-
-        duplicate_id = find_active_duplicate(task, payload_json)
+        duplicate_id = find_active_duplicate(task, payload)
         if duplicate_id:
             append_task_event(
                 db,
@@ -532,7 +511,7 @@ async def retry_ai_tasks(
         task.status = "pending"
         task.attempts = 0
         task.max_attempts = 1
-        task.payload = payload_json
+        task.payload = payload
         task.run_at = now_iso
         task.locked_at = None
         task.locked_by = None
@@ -540,6 +519,10 @@ async def retry_ai_tasks(
         task.last_error_type = None
         task.finished_at = None
         task.updated_at = now_iso
+        active_ids_by_key.setdefault(
+            build_dedupe_key(task.article_id, task.task_type, task.content_type, payload),
+            [],
+        ).insert(0, task.id)
         append_task_event(
             db,
             task_id=task.id,
@@ -5,6 +5,9 @@ from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine
 
 from app.core.settings import get_settings
 
@@ -29,10 +32,24 @@ def resolve_database_url(
     raise RuntimeError("无法解析数据库连接地址")
 
 
+def is_database_at_head(config: Config, database_url: str) -> bool:
+    head_revisions = set(ScriptDirectory.from_config(config).get_heads())
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as connection:
+            current_revisions = set(MigrationContext.configure(connection).get_current_heads())
+    finally:
+        engine.dispose()
+    return current_revisions == head_revisions
+
+
 def run_db_migrations(database_url: str | None = None) -> None:
     backend_dir = Path(__file__).resolve().parents[2]
     config = Config(str(backend_dir / "alembic.ini"))
     resolved_database_url = resolve_database_url(override_url=database_url)
     config.set_main_option("sqlalchemy.url", resolved_database_url)
     config.attributes["database_url_override"] = resolved_database_url
+    # 已在最新版本时跳过 env.py 加载与升级流程，启动只需读取一次 alembic_version
+    if is_database_at_head(config, resolved_database_url):
+        return
     command.upgrade(config, "head")
@@ -54,6 +54,8 @@ class AppSettings(BaseSettings):
     sqlite_synchronous: str = Field(default="NORMAL", alias="SQLITE_SYNCHRONOUS")
     sqlite_busy_timeout_ms: int = Field(default=5000, alias="SQLITE_BUSY_TIMEOUT_MS")
     sqlite_temp_store: int = Field(default=2, alias="SQLITE_TEMP_STORE")
+    sqlite_cache_size_kb: int = Field(default=65536, alias="SQLITE_CACHE_SIZE_KB")
+    sqlite_mmap_size_mb: int = Field(default=256, alias="SQLITE_MMAP_SIZE_MB")
     internal_api_token: str = Field(default="", alias="INTERNAL_API_TOKEN")
 
     allowed_origins: str = Field(default="", alias="ALLOWED_ORIGINS")
@@ -122,6 +124,10 @@ def validate_startup_settings(settings: AppSettings) -> None:
         errors.append("SQLITE_BUSY_TIMEOUT_MS 必须大于 0")
     if settings.sqlite_temp_store not in (0, 1, 2):
         errors.append("SQLITE_TEMP_STORE 仅支持 0/1/2")
+    if settings.sqlite_cache_size_kb <= 0:
+        errors.append("SQLITE_CACHE_SIZE_KB 必须大于 0")
+    if settings.sqlite_mmap_size_mb < 0:
+        errors.append("SQLITE_MMAP_SIZE_MB 不能小于 0")
 
     if not settings.internal_api_token.strip():
         errors.append("INTERNAL_API_TOKEN 不能为空")
@@ -1,7 +1,6 @@
-import json
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import or_
+from sqlalchemy import or_, update
 from sqlalchemy.exc import IntegrityError
 
 from app.core.settings import get_settings
@@ -10,12 +9,23 @@ from app.domain.article_embedding_service import ArticleEmbeddingService
 from app.domain.review_service import ReviewService
 from models import AITask, now_str
 from task_errors import TaskDataError
-from task_state import append_task_event, ensure_task_status_transition
+from task_state import append_task_event, append_task_events, ensure_task_status_transition
 
 settings = get_settings()
 ai_worker = settings.ai_worker
 LOCK_TIMEOUT_SECONDS = ai_worker.lock_timeout
 WORKER_ID = ai_worker.worker_id
+ARTICLE_TASK_TYPES = frozenset(
+    {
+        "process_article_cleaning",
+        "process_article_validation",
+        "process_article_classification",
+        "process_article_tagging",
+        "process_article_translation",
+        "process_ai_content",
+        "process_article_embedding",
+    }
+)
 
 
 def get_now_iso() -> str:
@@ -26,6 +36,12 @@ def get_stale_lock_iso() -> str:
     return (datetime.now(timezone.utc) - timedelta(seconds=LOCK_TIMEOUT_SECONDS)).isoformat()
 
 
+def get_poll_clock() -> tuple[str, str]:
+    # worker 每轮只取一次当前时间，同时算出 now 与锁过期阈值。
+    now = datetime.now(timezone.utc)
+    return now.isoformat(), (now - timedelta(seconds=LOCK_TIMEOUT_SECONDS)).isoformat()
+
+
 class AITaskService:
     def __init__(self, worker_id: str = WORKER_ID):
         self.worker_id = worker_id
@@ -40,15 +56,13 @@ class AITaskService:
         content_type: str | None = None,
         payload: dict | None = None,
     ) -> str:
-        payload_json = json.dumps(
-            payload or {}, ensure_ascii=False, sort_keys=True, separators=(",", ":")
-        )
+        payload = payload or {}
 
         def find_existing_task() -> AITask | None:
             existing_query = db.query(AITask).filter(
                 AITask.task_type == task_type,
                 AITask.status.in_(["pending", "processing"]),
-                AITask.payload == payload_json,
+                AITask.payload == payload,
             )
 
             if article_id is None:
@@ -72,11 +86,12 @@ class AITaskService:
             article_id=article_id,
             task_type=task_type,
             content_type=content_type,
-            payload=payload_json,
+            payload=payload,
             status="pending",
             attempts=0,
             max_attempts=1,
             run_at=now_iso,
+            created_at=now_iso,
             updated_at=now_iso,
         )
         db.add(task)
@@ -106,10 +121,16 @@ class AITaskService:
         db.refresh(task)
         return task.id
 
-    def claim_task(self, db) -> AITask | None:
-        self.review_service.enqueue_due_review_tasks(db, now_iso=get_now_iso())
-        now_iso = get_now_iso()
-        stale_lock_iso = get_stale_lock_iso()
+    def claim_task(
+        self,
+        db,
+        *,
+        now_iso: str | None = None,
+        stale_lock_iso: str | None = None,
+    ) -> AITask | None:
+        now_iso = now_iso or get_now_iso()
+        stale_lock_iso = stale_lock_iso or get_stale_lock_iso()
+        self.review_service.enqueue_due_review_tasks(db, now_iso=now_iso)
         task = (
             db.query(AITask)
             .filter(AITask.status == "pending")
@@ -124,28 +145,28 @@ class AITaskService:
         ensure_task_status_transition("pending", "processing")
 
         next_attempts = (task.attempts or 0) + 1
-        updated = (
-            db.query(AITask)
-            .filter(AITask.id == task.id, AITask.status == "pending")
-            .filter(or_(AITask.locked_at.is_(None), AITask.locked_at < stale_lock_iso))
-            .update(
-                {
-                    "status": "processing",
-                    "attempts": next_attempts,
-                    "locked_at": now_iso,
-                    "locked_by": self.worker_id,
-                    "updated_at": now_iso,
-                },
-                synchronize_session=False,
+        # UPDATE ... RETURNING 直接刷新会话中的任务对象，省去领取后的再次查询。
+        claimed = db.execute(
+            update(AITask)
+            .where(AITask.id == task.id, AITask.status == "pending")
+            .where(or_(AITask.locked_at.is_(None), AITask.locked_at < stale_lock_iso))
+            .values(
+                status="processing",
+                attempts=next_attempts,
+                locked_at=now_iso,
+                locked_by=self.worker_id,
+                updated_at=now_iso,
             )
-        )
-        if not updated:
+            .returning(AITask)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if claimed is None:
             db.commit()
             return None
 
         append_task_event(
             db,
-            task_id=task.id,
+            task_id=claimed.id,
             event_type="claimed",
             from_status="pending",
             to_status="processing",
@@ -156,7 +177,7 @@ class AITaskService:
             },
         )
         db.commit()
-        return db.query(AITask).filter(AITask.id == task.id).first()
+        return claimed
 
     def finish_task(
         self,
@@ -363,8 +384,11 @@ class AITaskService:
             db.close()
 
     async def run_task_async(self, task: AITask) -> None:
-        payload = json.loads(task.payload or "{}")
+        payload = task.payload or {}
         article_id = task.article_id
+        # 需要文章的任务类型在分发前统一校验一次 article_id。
+        if task.task_type in ARTICLE_TASK_TYPES:
+            article_id = self._require_article_id(article_id)
         category_id = payload.get("category_id")
         pipeline = ArticleAIPipelineService(
             current_task_id=task.id,
@@ -374,44 +398,44 @@ class AITaskService:
         handlers = {
             "process_article_cleaning": lambda: self._handle_process_article_cleaning(
                 pipeline,
-                self._require_article_id(article_id),
+                article_id,
                 category_id,
                 payload,
             ),
             "process_article_validation": lambda: self._handle_process_article_validation(
                 pipeline,
-                self._require_article_id(article_id),
+                article_id,
                 category_id,
                 payload,
             ),
             "process_article_classification": lambda: self._handle_process_article_classification(
                 pipeline,
-                self._require_article_id(article_id),
+                article_id,
                 category_id,
                 payload,
             ),
             "process_article_tagging": lambda: self._handle_process_article_tagging(
                 pipeline,
-                self._require_article_id(article_id),
+                article_id,
                 category_id,
                 payload,
             ),
             "process_article_translation": lambda: self._handle_process_article_translation(
                 pipeline,
-                self._require_article_id(article_id),
+                article_id,
                 category_id,
                 payload,
             ),
             "process_ai_content": lambda: self._handle_process_ai_content(
                 pipeline,
                 task,
-                self._require_article_id(article_id),
+                article_id,
                 category_id,
                 payload,
             ),
             "process_article_embedding": lambda: self._handle_process_article_embedding(
                 task.id,
-                self._require_article_id(article_id),
+                article_id,
             ),
             "generate_review_issue": lambda: self._handle_generate_review_issue(
                 task.id,
@@ -428,40 +452,62 @@ class AITaskService:
 
         await handler()
 
-    def cleanup_stale_tasks(self, db) -> int:
-        now_iso = get_now_iso()
-        stale_lock_iso = get_stale_lock_iso()
-        stale_tasks = (
-            db.query(AITask)
-            .filter(AITask.status == "processing")
-            .filter(AITask.locked_at.isnot(None))
-            .filter(AITask.locked_at < stale_lock_iso)
-            .all()
+    def cleanup_stale_tasks(
+        self,
+        db,
+        *,
+        now_iso: str | None = None,
+        stale_lock_iso: str | None = None,
+    ) -> int:
+        now_iso = now_iso or get_now_iso()
+        stale_lock_iso = stale_lock_iso or get_stale_lock_iso()
+        from_status = "processing"
+        target_status = "failed"
+        ensure_task_status_transition(from_status, target_status)
+        stale_filter = (
+            AITask.status == from_status,
+            AITask.locked_at.isnot(None),
+            AITask.locked_at < stale_lock_iso,
         )
-        cleaned = 0
-        for task in stale_tasks:
-            from_status = task.status
-            task.locked_at = None
-            task.locked_by = None
-            target_status = "failed"
-            ensure_task_status_transition(from_status, target_status)
-            task.status = target_status
-            task.finished_at = now_iso
-            event_type = "stale_lock_failed"
-            task.last_error = "任务超时或锁过期已重置"
-            task.last_error_type = "timeout"
-            task.updated_at = now_iso
-            append_task_event(
-                db,
-                task_id=task.id,
-                event_type=event_type,
-                from_status=from_status,
-                to_status=target_status,
-                message="任务超时或锁过期已重置",
-                error_type="timeout",
-                details={"worker_id": self.worker_id},
-            )
-            cleaned += 1
-        if cleaned:
+        # 先用只读探测判断是否存在过期锁，空闲轮询不开启写事务、不占用 SQLite 写锁。
+        if db.query(AITask.id).filter(*stale_filter).first() is None:
+            return 0
+        # 单条 UPDATE ... RETURNING 批量重置过期锁，只为实际被重置的任务写事件。
+        stale_task_ids = list(
+            db.execute(
+                update(AITask)
+                .where(*stale_filter)
+                .values(
+                    status=target_status,
+                    locked_at=None,
+                    locked_by=None,
+                    finished_at=now_iso,
+                    last_error="任务超时或锁过期已重置",
+                    last_error_type="timeout",
+                    updated_at=now_iso,
+                )
+                .returning(AITask.id)
+            ).scalars()
+        )
+        if not stale_task_ids:
+            # 探测后被并发清理或完成，UPDATE 已开启写事务，提交以释放写锁。
             db.commit()
-        return cleaned
+            return 0
+
+        append_task_events(
+            db,
+            (
+                {
+                    "task_id": task_id,
+                    "event_type": "stale_lock_failed",
+                    "from_status": from_status,
+                    "to_status": target_status,
+                    "message": "任务超时或锁过期已重置",
+                    "error_type": "timeout",
+                    "details": {"worker_id": self.worker_id},
+                }
+                for task_id in stale_task_ids
+            ),
+        )
+        db.commit()
+        return len(stale_task_ids)
@@ -8,7 +8,7 @@ from html import unescape
 from typing import Any
 from xml.etree import ElementTree as ET
 
-from ai_client import ConfigurableAIClient, is_english_content
+from ai_client import HAN_CHAR_PATTERN, ConfigurableAIClient, is_english_content
 from media_service import maybe_ingest_article_images_with_stats
 from sqlalchemy import or_
 from app.core.public_cache import (
@@ -56,6 +56,20 @@ BOOK_URL_PATTERN = re.compile(
     r"\.(pdf|epub|mobi)(\?.*)?$",
     re.IGNORECASE,
 )
+MATH_OPERATOR_LATEX_MAP = {
+    "−": "-",
+    "–": "-",
+    "—": "-",
+    "∗": r"\cdot ",
+    "·": r"\cdot ",
+    "×": r"\times ",
+    "÷": r"\div ",
+    "≤": r"\le ",
+    "≥": r"\ge ",
+    "≠": r"\neq ",
+    "≈": r"\approx ",
+    "∞": r"\infty ",
+}
 article_tag_service = ArticleTagService()
 
 
@@ -793,21 +807,7 @@ class ArticleAIPipelineService:
         return name.lower()
 
     def _normalize_math_operator(self, text: str) -> str:
-        mapping = {
-            "−": "-",
-            "–": "-",
-            "—": "-",
-            "∗": r"\cdot ",
-            "·": r"\cdot ",
-            "×": r"\times ",
-            "÷": r"\div ",
-            "≤": r"\le ",
-            "≥": r"\ge ",
-            "≠": r"\neq ",
-            "≈": r"\approx ",
-            "∞": r"\infty ",
-        }
-        return mapping.get(text, text)
+        return MATH_OPERATOR_LATEX_MAP.get(text, text)
 
     def _wrap_latex_group(self, value: str) -> str:
         text = (value or "").strip()
@@ -1285,7 +1285,7 @@ class ArticleAIPipelineService:
         content = text or ""
         if not content:
             return 0
-        cjk_chars = len(re.findall(r"[\u4e00-\u9fff]", content))
+        cjk_chars = 0 if content.isascii() else len(HAN_CHAR_PATTERN.findall(content))
         word_count = len(re.findall(r"[A-Za-z0-9_]+", content))
         symbol_chars = max(0, len(content) - cjk_chars)
         estimate = int(cjk_chars + (word_count * 1.3) + (symbol_chars * 0.2))
@@ -1787,19 +1787,14 @@ class ArticleAIPipelineService:
         task = db.query(AITask).filter(AITask.id == self.current_task_id).first()
         if not task:
             return
-        try:
-            payload = json.loads(task.payload or "{}")
-        except Exception:
-            payload = {}
+        payload = dict(task.payload) if isinstance(task.payload, dict) else {}
         changed = False
         for key, value in updates.items():
             if payload.get(key) != value:
                 payload[key] = value
                 changed = True
         if changed:
-            task.payload = json.dumps(
-                payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
-            )
+            task.payload = payload
             task.updated_at = now_str()
             db.commit()
 
@@ -20,6 +20,7 @@ from sqlalchemy.orm import Session
 from task_errors import TaskConfigError, TaskDataError
 
 EMBEDDING_TEXT_LIMIT = 4000
+EMBEDDING_SOURCE_HASH_BYTES = 16
 REMOTE_EMBEDDING_REQUIRED_MESSAGE = (
     "文章推荐未启用或未配置可用的远程向量模型，请先在后台完成配置"
 )
@@ -81,11 +82,16 @@ class ArticleEmbeddingService:
     def has_summary_source(self, article: Article) -> bool:
         return bool(self.get_embedding_source_text(article))
 
-    def get_embedding_source_hash(self, article: Article) -> str | None:
+    def compute_source_hash(self, source_text: str) -> bytes:
+        return hashlib.blake2b(
+            source_text.encode("utf-8"), digest_size=EMBEDDING_SOURCE_HASH_BYTES
+        ).digest()
+
+    def get_embedding_source_hash(self, article: Article) -> bytes | None:
         source_text = self.get_embedding_source_text(article)
         if not source_text:
             return None
-        return hashlib.sha256(source_text.encode("utf-8")).hexdigest()
+        return self.compute_source_hash(source_text)
 
     def cosine_similarity(self, vector_a: list[float], vector_b: list[float]) -> float:
         if not vector_a or not vector_b or len(vector_a) != len(vector_b):
@@ -123,7 +129,7 @@ class ArticleEmbeddingService:
 
         model_name = config["model_name"]
         model_label = model_name
-        source_hash = hashlib.sha256(source_text.encode("utf-8")).hexdigest()
+        source_hash = self.compute_source_hash(source_text)
 
         # 获取模型配置信息用于日志记录
         model_config = (
@@ -5,7 +5,7 @@ from urllib.parse import urlencode
 from xml.sax.saxutils import escape
 
 from sqlalchemy import func, literal, or_
-from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy.orm import Session, joinedload, load_only, undefer_group
 
 from models import AIAnalysis, Article, ArticleComment, Category, Tag
 
@@ -399,6 +399,8 @@ class ArticleQueryService:
         query = db.query(Article)
         if include_relations:
             query = query.options(
+                undefer_group("content"),
+                undefer_group("note"),
                 joinedload(Article.category).load_only(Category.id, Category.name, Category.color),
                 joinedload(Article.tags).load_only(Tag.id, Tag.name),
                 joinedload(Article.ai_analysis).load_only(
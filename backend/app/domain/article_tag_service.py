@@ -6,9 +6,10 @@ import re
 from collections.abc import Iterable
 
 from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from models import AIAnalysis, Article, Tag, article_tags, now_str
+from models import AIAnalysis, Article, Tag, article_tags, generate_uuid, now_str
 
 _LEADING_HASH_RE = re.compile(r"^#+")
 _MULTI_SPACE_RE = re.compile(r"\s+")
@@ -145,21 +146,27 @@ class ArticleTagService:
             for tag in db.query(Tag).filter(Tag.normalized_name.in_(normalized_names)).all():
                 existing_tags[tag.normalized_name] = tag
 
-        desired_tags: list[Tag] = []
-        for tag_name in normalized_tag_names:
-            normalized_name = tag_name.casefold()
-            tag = existing_tags.get(normalized_name)
-            if not tag:
-                tag = Tag(
-                    name=tag_name,
-                    normalized_name=normalized_name,
-                    created_at=now_str(),
-                    updated_at=now_str(),
+        missing_tag_names = [
+            tag_name
+            for tag_name in normalized_tag_names
+            if tag_name.casefold() not in existing_tags
+        ]
+        if missing_tag_names:
+            self._insert_missing_tags(db, missing_tag_names)
+            for tag in (
+                db.query(Tag)
+                .filter(
+                    Tag.normalized_name.in_(
+                        [tag_name.casefold() for tag_name in missing_tag_names]
+                    )
                 )
-                db.add(tag)
-                db.flush()
-                existing_tags[normalized_name] = tag
-            desired_tags.append(tag)
+                .all()
+            ):
+                existing_tags[tag.normalized_name] = tag
+
+        desired_tags = [
+            existing_tags[tag_name.casefold()] for tag_name in normalized_tag_names
+        ]
 
         article.tags = desired_tags
         article.updated_at = now_str()
@@ -177,6 +184,31 @@ class ArticleTagService:
         self.cleanup_orphan_tags(db, tag_ids=affected_tag_ids)
         return desired_tags
 
+    def _insert_missing_tags(self, db: Session, tag_names: list[str]) -> None:
+        # 单条 INSERT ... ON CONFLICT DO NOTHING 批量建标签，并发 worker 写入同名标签时不会冲突
+        dialect_insert = (
+            postgresql.insert
+            if db.get_bind().dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        now_iso = now_str()
+        db.execute(
+            dialect_insert(Tag)
+            .values(
+                [
+                    {
+                        "id": generate_uuid(),
+                        "name": tag_name,
+                        "normalized_name": tag_name.casefold(),
+                        "created_at": now_iso,
+                        "updated_at": now_iso,
+                    }
+                    for tag_name in tag_names
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[Tag.normalized_name])
+        )
+
     def mark_tagging_pending(
         self,
         db: Session,
@@ -12,7 +12,7 @@ from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
 from sqlalchemy import and_, case, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, undefer_group
 
 from ai_client import ConfigurableAIClient
 from app.core.settings import get_settings
@@ -27,6 +27,7 @@ from models import (
     ReviewIssue,
     ReviewIssueArticle,
     ReviewTemplate,
+    bulk_insert,
     now_str,
 )
 
@@ -172,11 +173,15 @@ class ReviewService:
         window_end: str,
         article_ids: list[str] | None = None,
     ) -> list[Article]:
+        query_options = [joinedload(Article.category), joinedload(Article.ai_analysis)]
+        if template.review_input_mode == REVIEW_INPUT_MODE_FULL_TEXT:
+            # 全文模式会逐篇读取正文，随主查询加载延迟的 content 列，避免逐篇懒加载。
+            query_options.append(undefer_group("content"))
         query = (
             db.query(Article)
             .outerjoin(Category, Category.id == Article.category_id)
             .outerjoin(AIAnalysis, AIAnalysis.article_id == Article.id)
-            .options(joinedload(Article.category), joinedload(Article.ai_analysis))
+            .options(*query_options)
             .filter(Article.created_at >= window_start)
             .filter(Article.created_at < window_end)
             .filter(Article.is_visible == True)
@@ -596,6 +601,8 @@ class ReviewService:
             .filter(ReviewTemplate.next_run_at <= current_iso)
             .all()
         )
+        if not templates:
+            return 0
         created = 0
         task_service = AITaskService()
         for template in templates:
@@ -654,20 +661,27 @@ class ReviewService:
             window_end=issue.window_end,
             article_ids=article_ids,
         )
-        issue.articles.clear()
+        db.query(ReviewIssueArticle).filter(ReviewIssueArticle.issue_id == issue.id).delete(
+            synchronize_session=False
+        )
+        linked_at = now_str()
+        rows = []
         for index, article in enumerate(articles, start=1):
             category = article.category
             sort_order = category.sort_order if category and category.sort_order is not None else 999999
-            issue.articles.append(
-                ReviewIssueArticle(
-                    article_id=article.id,
-                    category_id=category.id if category else None,
-                    category_sort_order=sort_order,
-                    article_sort_order=index,
-                    created_at=now_str(),
-                    updated_at=now_str(),
-                )
+            rows.append(
+                {
+                    "issue_id": issue.id,
+                    "article_id": article.id,
+                    "category_id": category.id if category else None,
+                    "category_sort_order": sort_order,
+                    "article_sort_order": index,
+                    "created_at": linked_at,
+                    "updated_at": linked_at,
+                }
             )
+        bulk_insert(db, ReviewIssueArticle, rows)
+        db.expire(issue, ["articles"])
 
         issue.markdown_content = await self.generate_issue_markdown(
             db,
@@ -1452,6 +1466,7 @@ class ReviewService:
         window: ReviewWindow | None = None,
     ) -> str:
         current_dt = datetime.fromisoformat(current_iso.replace("Z", "+00:00"))
+        materialized_at = now_str()
         resolved_window = window or self.resolve_window(template, current_iso)
         issue_number = self._get_issue_number_for_window(
             db,
@@ -1478,8 +1493,8 @@ class ReviewService:
             window_start=resolved_window.start,
             window_end=resolved_window.end,
             markdown_content=self.build_default_markdown(issue_title),
-            created_at=now_str(),
-            updated_at=now_str(),
+            created_at=materialized_at,
+            updated_at=materialized_at,
         )
         db.add(issue)
         db.flush()
@@ -1490,7 +1505,7 @@ class ReviewService:
         )
         template.last_run_at = current_iso
         template.next_run_at = resolved_window.next_run_at
-        template.updated_at = now_str()
+        template.updated_at = materialized_at
         return task_id
 
     def _build_issue_list_query(
@@ -2053,12 +2068,10 @@ class ReviewService:
     ) -> str:
         safe_period = period_label.replace(" ", "-").replace("~", "to")
         base_slug = f"{template.slug}-{run_date.isoformat()}-{safe_period}".lower()
-        slug = base_slug
-        suffix = 2
-        while db.query(ReviewIssue.id).filter(ReviewIssue.slug == slug).first():
-            slug = f"{base_slug}-v{suffix}"
-            suffix += 1
-        return slug
+        taken_slugs = self._load_taken_issue_slugs(db, base_slug)
+        if base_slug not in taken_slugs:
+            return base_slug
+        return self._pick_versioned_slug(base_slug, taken_slugs)
 
     def _promote_issue_slug_on_publish(self, db: Session, issue: ReviewIssue) -> None:
         canonical_slug = self._canonicalize_issue_slug(issue.slug)
@@ -2093,15 +2106,34 @@ class ReviewService:
         *,
         ignore_issue_id: str | None = None,
     ) -> str:
+        taken_slugs = self._load_taken_issue_slugs(
+            db, base_slug, ignore_issue_id=ignore_issue_id
+        )
+        return self._pick_versioned_slug(base_slug, taken_slugs)
+
+    def _load_taken_issue_slugs(
+        self,
+        db: Session,
+        base_slug: str,
+        *,
+        ignore_issue_id: str | None = None,
+    ) -> set[str]:
+        # 一次取回 base_slug 及其全部 -vN 版本，避免逐个候选 slug 查询数据库
+        query = db.query(ReviewIssue.slug).filter(
+            or_(
+                ReviewIssue.slug == base_slug,
+                ReviewIssue.slug.like(f"{base_slug}-v%"),
+            )
+        )
+        if ignore_issue_id:
+            query = query.filter(ReviewIssue.id != ignore_issue_id)
+        return {slug for (slug,) in query.all()}
+
+    def _pick_versioned_slug(self, base_slug: str, taken_slugs: set[str]) -> str:
         suffix = 2
-        while True:
-            candidate = f"{base_slug}-v{suffix}"
-            query = db.query(ReviewIssue.id).filter(ReviewIssue.slug == candidate)
-            if ignore_issue_id:
-                query = query.filter(ReviewIssue.id != ignore_issue_id)
-            if not query.first():
-                return candidate
+        while f"{base_slug}-v{suffix}" in taken_slugs:
             suffix += 1
+        return f"{base_slug}-v{suffix}"
 
     def _normalize_article_ids(self, article_ids: list[str]) -> list[str]:
         normalized: list[str] = []
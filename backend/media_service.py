@@ -39,6 +39,10 @@ BOOK_EXTENSION_TO_CONTENT_TYPE = {
     extension: content_type
     for content_type, extension in BOOK_CONTENT_TYPE_TO_EXTENSION.items()
 }
+MARKDOWN_MEDIA_REFERENCE_PATTERNS = (
+    re.compile(r"!\[[^\]]*\]\((\S+?)(?:\s+\"[^\"]*\")?\)"),
+    re.compile(r"(?<!!)\[[^\]]*\]\((\S+?)(?:\s+\"[^\"]*\")?\)"),
+)
 
 
 def ensure_media_root() -> None:
@@ -586,11 +590,7 @@ def _extract_media_paths_from_markdown(content: str) -> set[str]:
     if not content:
         return set()
     paths: set[str] = set()
-    patterns = [
-        re.compile(r"!\[[^\]]*\]\((\S+?)(?:\s+\"[^\"]*\")?\)"),
-        re.compile(r"(?<!!)\[[^\]]*\]\((\S+?)(?:\s+\"[^\"]*\")?\)"),
-    ]
-    for pattern in patterns:
+    for pattern in MARKDOWN_MEDIA_REFERENCE_PATTERNS:
         for match in pattern.finditer(content):
             rel = _extract_internal_media_rel_path(match.group(1) or "")
             if rel:
@@ -6,13 +6,19 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Float,
+    Index,
+    LargeBinary,
     Table,
+    TypeDecorator,
     create_engine,
     event,
+    text,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import declarative_base, deferred, relationship, sessionmaker
 from datetime import date, datetime, timezone
-import uuid
+import json
+import os
+import time
 from app.core.db_migrations import run_db_migrations
 from app.core.note_recommendation import DEFAULT_NOTE_RECOMMENDATION_LEVEL
 from app.core.settings import get_settings
@@ -31,7 +37,10 @@ if IS_SQLITE:
     }
 
 engine = create_engine(DATABASE_URL, connect_args=engine_connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 提交后不失效属性：接口提交后直接序列化对象时无需逐个重新 SELECT
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 if IS_SQLITE:
@@ -45,6 +54,9 @@ if IS_SQLITE:
             cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous.upper()}")
             cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
             cursor.execute(f"PRAGMA temp_store={settings.sqlite_temp_store}")
+            # cache_size 取负值表示以 KiB 计；mmap 让热点页直接走内存映射读取
+            cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_size_kb}")
+            cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size_mb * 1024 * 1024}")
         finally:
             cursor.close()
 
@@ -57,8 +69,54 @@ def get_db():
         db.close()
 
 
+def bulk_insert(session, model, dict_rows, chunk_size: int = 1000) -> None:
+    """按块以 Core executemany 批量插入，跳过 ORM 逐对象 flush；列默认值照常生效，关系属性需调用方自行过期。"""
+    if not dict_rows:
+        return
+    stmt = model.__table__.insert()
+    for start in range(0, len(dict_rows), chunk_size):
+        session.execute(stmt, dict_rows[start : start + chunk_size])
+
+
+class JSONText(TypeDecorator):
+    """JSON 值以紧凑、键有序的文本存储，与任务去重索引使用的序列化格式一致。"""
+
+    impl = Text
+    cache_ok = True
+
+    @staticmethod
+    def dumps(value) -> str | None:
+        if value is None:
+            return None
+        return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+    def process_bind_param(self, value, dialect):
+        return self.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+
+
+_UTC = timezone.utc
+
+
 def generate_uuid():
-    return str(uuid.uuid4())
+    # UUIDv7 布局的 32 位十六进制串：48 位毫秒时间戳在前，新主键追加到 B-tree 末尾，避免随机插入导致的页分裂
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & ((1 << 62) - 1)
+    )
+    return f"{value:032x}"
 
 
 def today_str():
@@ -66,7 +124,8 @@ def today_str():
 
 
 def now_str():
-    return datetime.now(timezone.utc).isoformat()
+    # 保留微秒：任务事件与队列按 created_at/run_at 排序，秒级精度会产生大量并列
+    return datetime.now(_UTC).isoformat()
 
 
 article_tags = Table(
@@ -139,20 +198,31 @@ class Tag(Base):
 
 class Article(Base):
     __tablename__ = "articles"
+    __table_args__ = (
+        # 部分唯一索引：NULL 不进入索引，也不会互相冲突
+        Index(
+            "idx_articles_source_url_unique",
+            "source_url",
+            unique=True,
+            sqlite_where=text("source_url IS NOT NULL"),
+            postgresql_where=text("source_url IS NOT NULL"),
+        ),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     title = Column(String, nullable=False)
     title_trans = Column(String, nullable=True)
     slug = Column(String, unique=True, nullable=False, index=True)  # SEO友好的URL slug
-    content_html = Column(Text, nullable=True)
-    content_structured = Column(Text, nullable=True)
-    content_md = Column(Text)
-    content_trans = Column(Text)
+    # 正文/笔记大字段按需加载，列表查询不拉取；详情页通过 undefer_group 一次取回
+    content_html = deferred(Column(Text, nullable=True), group="content")
+    content_structured = deferred(Column(Text, nullable=True), group="content")
+    content_md = deferred(Column(Text), group="content")
+    content_trans = deferred(Column(Text), group="content")
     translation_status = Column(
         String, default=None
     )  # None, pending, processing, completed, failed
     translation_error = Column(Text, nullable=True)  # 翻译失败时的错误信息
-    source_url = Column(String, unique=True, nullable=True)
+    source_url = Column(String, nullable=True)
     top_image = Column(String)
     author = Column(String)
     published_at = Column(String)
@@ -163,8 +233,8 @@ class Article(Base):
     category_id = Column(String, ForeignKey("categories.id"))
     created_at = Column(String, default=now_str)
     updated_at = Column(String, default=now_str)
-    note_content = Column(Text, nullable=True)
-    note_annotations = Column(Text, nullable=True)
+    note_content = deferred(Column(Text, nullable=True), group="note")
+    note_annotations = deferred(Column(Text, nullable=True), group="note")
     note_recommendation_level = Column(
         String,
         nullable=False,
@@ -316,7 +386,7 @@ class AITask(Base):
     task_type = Column(String, nullable=False)
     content_type = Column(String, nullable=True)
     status = Column(String, default="pending")
-    payload = Column(Text, nullable=True)
+    payload = Column(JSONText, nullable=True)
     attempts = Column(Integer, default=0)
     max_attempts = Column(Integer, default=1)
     run_at = Column(String, default=now_str)
@@ -349,7 +419,7 @@ class AITaskEvent(Base):
     to_status = Column(String, nullable=True)
     message = Column(Text, nullable=True)
     error_type = Column(String, nullable=True)
-    details = Column(Text, nullable=True)
+    details = Column(JSONText, nullable=True)
     created_at = Column(String, default=now_str)
 
     task = relationship("AITask", back_populates="events")
@@ -400,7 +470,7 @@ class ArticleEmbedding(Base):
     )
     model = Column(String, nullable=True)
     embedding = Column(Text, nullable=False)
-    source_hash = Column(String, nullable=True)
+    source_hash = Column(LargeBinary(16), nullable=True)
     created_at = Column(String, default=now_str)
     updated_at = Column(String, default=now_str)
 
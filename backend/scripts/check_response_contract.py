@@ -6,14 +6,29 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Any, Callable
+
+import httpx
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 BASELINE_DEFAULT_PATH = BACKEND_DIR / "scripts" / "response_contract_baseline.json"
+BODY_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+# 所有用例共用一个连接池，复用 keep-alive 连接，避免每个用例重新握手。
+HTTP_CLIENT = httpx.Client(
+    timeout=httpx.Timeout(10.0, pool=None),
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+)
 
 
 @dataclass(frozen=True)
@@ -25,10 +40,36 @@ class ContractCase:
     body_type: str | None
     required_paths: tuple[str, ...]
     required_when_nonempty_paths: tuple[str, ...]
+    required_path_tokens: tuple[tuple[str, ...] | None, ...] = field(init=False)
+    required_when_nonempty_path_tokens: tuple[tuple[str, ...] | None, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # 构造时一次性拆分并反转义 JSON Pointer，校验时只做逐级查找。
+        object.__setattr__(
+            self,
+            "required_path_tokens",
+            tuple(parse_pointer(v) for v in self.required_paths),
+        )
+        object.__setattr__(
+            self,
+            "required_when_nonempty_path_tokens",
+            tuple(parse_pointer(v) for v in self.required_when_nonempty_paths),
+        )
+
+
+def parse_pointer(pointer: str) -> tuple[str, ...] | None:
+    if pointer in {"", "/"}:
+        return ()
+    if not pointer.startswith("/"):
+        return None
+    return tuple(
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer.lstrip("/").split("/")
+    )
 
 
 def load_cases(path: Path) -> list[ContractCase]:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = json.loads(path.read_bytes())
     if not isinstance(raw, list):
         raise ValueError("response baseline 必须是数组")
 
@@ -57,16 +98,11 @@ def load_cases(path: Path) -> list[ContractCase]:
         else:
             raise ValueError(f"{name}: expected_status 必须是 int 或 int 数组")
 
-        if body_type is not None and body_type not in {
-            "object",
-            "array",
-            "string",
-            "number",
-            "boolean",
-            "null",
-        }:
+        if body_type is not None and body_type not in BODY_TYPE_CHECKS:
             raise ValueError(f"{name}: 不支持的 body_type: {body_type}")
 
+        required_path_values = tuple(str(v) for v in required_paths)
+        required_when_nonempty_values = tuple(str(v) for v in required_when_nonempty)
         cases.append(
             ContractCase(
                 name=name,
@@ -74,8 +110,8 @@ def load_cases(path: Path) -> list[ContractCase]:
                 path=path_value,
                 expected_statuses=expected_statuses,
                 body_type=body_type,
-                required_paths=tuple(str(v) for v in required_paths),
-                required_when_nonempty_paths=tuple(str(v) for v in required_when_nonempty),
+                required_paths=required_path_values,
+                required_when_nonempty_paths=required_when_nonempty_values,
             )
         )
 
@@ -85,34 +121,24 @@ def load_cases(path: Path) -> list[ContractCase]:
 def parse_json_body(raw_body: bytes) -> Any:
     if not raw_body:
         return None
-    return json.loads(raw_body.decode("utf-8"))
+    return json.loads(raw_body)
 
 
 def is_expected_type(value: Any, expected: str) -> bool:
-    if expected == "object":
-        return isinstance(value, dict)
-    if expected == "array":
-        return isinstance(value, list)
-    if expected == "string":
-        return isinstance(value, str)
-    if expected == "number":
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if expected == "boolean":
-        return isinstance(value, bool)
-    if expected == "null":
-        return value is None
-    return False
+    check = BODY_TYPE_CHECKS.get(expected)
+    return check is not None and check(value)
 
 
 def path_exists(value: Any, pointer: str) -> bool:
-    if pointer in {"", "/"}:
-        return True
-    if not pointer.startswith("/"):
+    return path_exists_tokens(value, parse_pointer(pointer))
+
+
+def path_exists_tokens(value: Any, tokens: tuple[str, ...] | None) -> bool:
+    if tokens is None:
         return False
 
     current = value
-    for token in pointer.lstrip("/").split("/"):
-        token = token.replace("~1", "/").replace("~0", "~")
+    for token in tokens:
         if isinstance(current, dict):
             if token not in current:
                 return False
@@ -130,23 +156,32 @@ def path_exists(value: Any, pointer: str) -> bool:
     return True
 
 
-def request_once(base_url: str, case: ContractCase) -> tuple[int, bytes]:
-    url = f"{base_url.rstrip('/')}{case.path}"
-    request = Request(url=url, method=case.method)
+def needs_body(case: ContractCase) -> bool:
+    return bool(
+        case.body_type is not None
+        or case.required_paths
+        or case.required_when_nonempty_paths
+    )
+
+
+def request_once(
+    base_url: str, case: ContractCase, need_body: bool = True
+) -> tuple[int, bytes]:
+    url = base_url + case.path
     try:
-        with urlopen(request, timeout=10) as response:
-            return response.status, response.read()
-    except HTTPError as exc:
-        return exc.code, exc.read()
-    except URLError as exc:
-        raise RuntimeError(f"请求失败: {url} ({exc.reason})") from exc
+        # 只校验状态码的用例不读取响应体，避免下载大列表或 RSS 内容。
+        with HTTP_CLIENT.stream(case.method, url) as response:
+            return response.status_code, response.read() if need_body else b""
+    except httpx.HTTPError as exc:
+        raise RuntimeError(f"请求失败: {url} ({exc})") from exc
 
 
 def validate_case(base_url: str, case: ContractCase) -> list[str]:
     errors: list[str] = []
+    need_body = needs_body(case)
 
     try:
-        status, raw_body = request_once(base_url, case)
+        status, raw_body = request_once(base_url, case, need_body)
     except Exception as exc:
         return [f"{case.name}: {exc}"]
 
@@ -155,7 +190,7 @@ def validate_case(base_url: str, case: ContractCase) -> list[str]:
         errors.append(f"{case.name}: 状态码不匹配，期望 {expected}，实际 {status}")
         return errors
 
-    if case.body_type is None and not case.required_paths and not case.required_when_nonempty_paths:
+    if not need_body:
         return errors
 
     try:
@@ -168,19 +203,22 @@ def validate_case(base_url: str, case: ContractCase) -> list[str]:
         errors.append(f"{case.name}: body_type 不匹配，期望 {case.body_type}")
         return errors
 
-    for pointer in case.required_paths:
-        if not path_exists(body, pointer):
+    for pointer, tokens in zip(case.required_paths, case.required_path_tokens):
+        if not path_exists_tokens(body, tokens):
             errors.append(f"{case.name}: 缺少字段路径 {pointer}")
 
+    nonempty_paths = tuple(
+        zip(case.required_when_nonempty_paths, case.required_when_nonempty_path_tokens)
+    )
     if isinstance(body, list) and body:
-        for pointer in case.required_when_nonempty_paths:
-            if not path_exists(body, pointer):
+        for pointer, tokens in nonempty_paths:
+            if not path_exists_tokens(body, tokens):
                 errors.append(f"{case.name}: 非空数组时缺少字段路径 {pointer}")
 
-    if isinstance(body, dict) and case.required_when_nonempty_paths:
-        for pointer in case.required_when_nonempty_paths:
+    if isinstance(body, dict) and nonempty_paths:
+        for pointer, tokens in nonempty_paths:
             if pointer.startswith("/data/0") and isinstance(body.get("data"), list) and body["data"]:
-                if not path_exists(body, pointer):
+                if not path_exists_tokens(body, tokens):
                     errors.append(f"{case.name}: data 非空时缺少字段路径 {pointer}")
 
     return errors
@@ -198,6 +236,12 @@ def main() -> int:
         default=str(BASELINE_DEFAULT_PATH),
         help="Response contract baseline json path",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of cases requested in parallel, default: 8",
+    )
     parser.add_argument("--verbose", action="store_true", help="Print each case status")
     args = parser.parse_args()
 
@@ -212,9 +256,16 @@ def main() -> int:
         print(f"FAIL: 无法读取 response baseline: {exc}")
         return 1
 
+    # 各用例互相独立且以网络等待为主，并发请求后按原顺序汇总结果。
+    base_url = args.base_url.rstrip("/")
+    max_workers = max(1, min(args.concurrency, len(cases) or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(lambda case: validate_case(base_url, case), cases)
+        )
+
     all_errors: list[str] = []
-    for case in cases:
-        case_errors = validate_case(args.base_url, case)
+    for case, case_errors in zip(cases, results):
         if args.verbose:
             state = "PASS" if not case_errors else "FAIL"
             print(f"{state}: {case.name}")
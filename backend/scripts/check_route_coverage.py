@@ -25,6 +25,9 @@ if str(BACKEND_DIR) not in sys.path:
 from app.main import app as modular_app
 
 BASELINE_DEFAULT_PATH = BACKEND_DIR / "scripts" / "route_contract_baseline.json"
+IGNORED_METHODS = frozenset({"HEAD", "OPTIONS"})
+CONTRACT_PATH_PREFIXES = ("/api", "/backend/api")
+CONTRACT_ROOT_PATHS = frozenset({"/", "/backend", "/backend/"})
 
 
 @dataclass(frozen=True, order=True)
@@ -42,38 +45,32 @@ def normalize_path(path: str) -> str:
 
 
 def normalize_methods(route: APIRoute) -> tuple[str, ...]:
-    methods = route.methods or set()
-    return tuple(sorted(method for method in methods if method not in {"HEAD", "OPTIONS"}))
+    return tuple(sorted((route.methods or set()) - IGNORED_METHODS))
+
+
+def is_contract_path(raw_path: str) -> bool:
+    return raw_path.startswith(CONTRACT_PATH_PREFIXES) or raw_path in CONTRACT_ROOT_PATHS
 
 
 def collect_routes(app) -> tuple[set[RouteKey], Counter[RouteKey]]:
-    keys: list[RouteKey] = []
-    for route in app.routes:
-        if not isinstance(route, APIRoute):
-            continue
-        raw_path = route.path
-        if not (
-            raw_path.startswith("/api")
-            or raw_path == "/"
-            or raw_path.startswith("/backend/api")
-            or raw_path in {"/backend", "/backend/"}
-        ):
-            continue
-        key = RouteKey(path=normalize_path(raw_path), methods=normalize_methods(route))
-        keys.append(key)
-    return set(keys), Counter(keys)
+    counter = Counter(
+        RouteKey(path=normalize_path(route.path), methods=normalize_methods(route))
+        for route in app.routes
+        if isinstance(route, APIRoute) and is_contract_path(route.path)
+    )
+    return set(counter), counter
 
 
 def load_baseline_routes(baseline_path: Path) -> tuple[set[RouteKey], Counter[RouteKey]]:
-    raw = json.loads(baseline_path.read_text(encoding="utf-8"))
-    keys: list[RouteKey] = []
+    raw = json.loads(baseline_path.read_bytes())
+    counter: Counter[RouteKey] = Counter()
     for item in raw:
         path = item.get("path")
         methods = tuple(item.get("methods") or [])
         if not isinstance(path, str):
             raise ValueError("route baseline item missing path")
-        keys.append(RouteKey(path=path, methods=methods))
-    return set(keys), Counter(keys)
+        counter[RouteKey(path=path, methods=methods)] += 1
+    return set(counter), counter
 
 
 def write_baseline_routes(baseline_path: Path, routes: set[RouteKey]) -> None:
@@ -124,10 +121,10 @@ def main() -> int:
 
     baseline_routes, baseline_counter = load_baseline_routes(baseline_path)
 
-    missing = sorted(baseline_routes - modular_routes)
-    extra = sorted(modular_routes - baseline_routes)
-    baseline_dupes = sorted([key for key, count in baseline_counter.items() if count > 1])
-    modular_dupes = sorted([key for key, count in modular_counter.items() if count > 1])
+    missing = baseline_routes - modular_routes
+    extra = modular_routes - baseline_routes
+    baseline_dupes = [key for key, count in baseline_counter.items() if count > 1]
+    modular_dupes = [key for key, count in modular_counter.items() if count > 1]
 
     print("Route coverage check")
     print(f"  baseline routes: {len(baseline_routes)}")
@@ -138,11 +135,11 @@ def main() -> int:
     print(f"  modular dupes  : {len(modular_dupes)}")
 
     if args.verbose and missing:
-        print_routes("Missing routes in modular app:", missing)
+        print_routes("Missing routes in modular app:", sorted(missing))
     if args.verbose and extra:
-        print_routes("Extra routes in modular app:", extra)
+        print_routes("Extra routes in modular app:", sorted(extra))
     if args.verbose and modular_dupes:
-        print_routes("Duplicate signatures in modular app:", modular_dupes)
+        print_routes("Duplicate signatures in modular app:", sorted(modular_dupes))
 
     has_error = bool(missing or extra or modular_dupes or baseline_dupes)
     if has_error:
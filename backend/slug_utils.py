@@ -1,8 +1,11 @@
 """URL slug生成工具，支持中文转拼音"""
 
+from functools import lru_cache
+
 from slugify import slugify
 
 
+@lru_cache(maxsize=4096)
 def generate_slug(title: str, max_length: int = 50) -> str:
     """
     将标题转换为拼音slug
@@ -28,18 +31,10 @@ def generate_slug(title: str, max_length: int = 50) -> str:
     if not slug:
         return "untitled"
 
-    # 限制长度，保留完整单词
+    # 限制长度，保留完整单词：在截断点之前找最后一个分隔符
     if len(slug) > max_length:
-        parts = slug.split("-")
-        result = []
-        current_len = 0
-        for part in parts:
-            if current_len + len(part) + 1 <= max_length:
-                result.append(part)
-                current_len += len(part) + 1
-            else:
-                break
-        slug = "-".join(result) if result else slug[:max_length]
+        cut = slug.rfind("-", 0, max_length)
+        slug = slug[:cut] if cut > 0 else slug[:max_length]
 
     return slug
 
@@ -57,10 +52,13 @@ def generate_article_slug(title: str, article_id: str) -> str:
         article_id: 文章UUID
 
     Returns:
-        完整的slug，包含拼音和ID前8位保证唯一性
+        完整的slug，包含拼音和ID中8位随机十六进制字符保证唯一性
     """
     slug = generate_slug(title)
-    short_id = article_id.split("-")[0]  # 取UUID第一段（8字符）保证唯一性
+    if "-" in article_id:
+        short_id = article_id.split("-")[0][:8]  # 旧式UUID取前8个十六进制字符
+    else:
+        short_id = article_id[-8:]  # 时间有序ID前缀是时间戳，取末尾随机部分
     return f"{slug}-{short_id}"
 
 
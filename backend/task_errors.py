@@ -1,4 +1,10 @@
 import asyncio
+import re
+
+# 英文关键字不区分大小写，中文关键字按原文匹配；每类错误只扫描一次消息。
+TIMEOUT_ERROR_PATTERN = re.compile(r"(?i:timeout)|超时")
+CONFIG_ERROR_PATTERN = re.compile(r"(?i:config|disabled)|ai服务|禁用")
+DATA_ERROR_PATTERN = re.compile(r"文章不存在|缺少|未通过|格式异常|无效")
 
 
 class TaskPipelineError(Exception):
@@ -34,27 +40,14 @@ def normalize_task_error(exc: Exception) -> TaskPipelineError:
         return exc
 
     message = str(exc)
-    lowered = message.lower()
 
-    if isinstance(exc, asyncio.TimeoutError) or "timeout" in lowered or "超时" in message:
+    if isinstance(exc, asyncio.TimeoutError) or TIMEOUT_ERROR_PATTERN.search(message):
         return TaskTimeoutError(message)
 
-    if (
-        "未配置ai服务" in message
-        or "ai服务" in message
-        or "config" in lowered
-        or "禁用" in message
-        or "disabled" in lowered
-    ):
+    if CONFIG_ERROR_PATTERN.search(message):
         return TaskConfigError(message)
 
-    if (
-        "文章不存在" in message
-        or "缺少" in message
-        or "未通过" in message
-        or "格式异常" in message
-        or "无效" in message
-    ):
+    if DATA_ERROR_PATTERN.search(message):
         return TaskDataError(message)
 
     return TaskExternalError(message)
@@ -1,4 +1,4 @@
-import json
+from collections.abc import Iterable
 
 from models import AITaskEvent, now_str
 
@@ -21,13 +21,15 @@ ALLOWED_TASK_STATUS_TRANSITIONS = {
     TASK_STATUS_CANCELLED: {TASK_STATUS_PENDING},
     TASK_STATUS_COMPLETED: {TASK_STATUS_PENDING},
 }
+ALLOWED_TASK_STATUS_TRANSITION_PAIRS = frozenset(
+    (current_status, target_status)
+    for current_status, targets in ALLOWED_TASK_STATUS_TRANSITIONS.items()
+    for target_status in targets
+)
 
 
 def can_transition_task_status(current_status: str, target_status: str) -> bool:
-    if current_status == target_status:
-        return False
-    allowed = ALLOWED_TASK_STATUS_TRANSITIONS.get(current_status, set())
-    return target_status in allowed
+    return (current_status, target_status) in ALLOWED_TASK_STATUS_TRANSITION_PAIRS
 
 
 def ensure_task_status_transition(current_status: str, target_status: str) -> None:
@@ -36,6 +38,32 @@ def ensure_task_status_transition(current_status: str, target_status: str) -> No
     raise ValueError(f"非法任务状态流转: {current_status} -> {target_status}")
 
 
+def build_task_event(
+    task_id: str,
+    event_type: str,
+    from_status: str | None,
+    to_status: str | None,
+    message: str | None = None,
+    error_type: str | None = None,
+    details: dict | None = None,
+) -> AITaskEvent:
+    return AITaskEvent(
+        task_id=task_id,
+        event_type=event_type,
+        from_status=from_status,
+        to_status=to_status,
+        message=message,
+        error_type=error_type,
+        details=details or None,
+        created_at=now_str(),
+    )
+
+
+def append_task_events(db, events: Iterable[dict]) -> None:
+    # 主键由客户端生成，同批事件在 flush 时合并为一次 executemany INSERT。
+    db.add_all([build_task_event(**event) for event in events])
+
+
 def append_task_event(
     db,
     task_id: str,
@@ -47,14 +75,13 @@ def append_task_event(
     details: dict | None = None,
 ) -> None:
     db.add(
-        AITaskEvent(
+        build_task_event(
             task_id=task_id,
             event_type=event_type,
             from_status=from_status,
             to_status=to_status,
             message=message,
             error_type=error_type,
-            details=json.dumps(details, ensure_ascii=False) if details else None,
-            created_at=now_str(),
+            details=details,
         )
     )
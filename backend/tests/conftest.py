@@ -1,30 +1,68 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+import asyncio
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from models import AITask, AITaskEvent, Base, now_str
 
 
-@pytest.fixture()
-def db_session(tmp_path) -> Iterator[Session]:
-    db_path = tmp_path / "unit-tests.db"
+@pytest.fixture(scope="session")
+def db_engine() -> Iterator[Engine]:
     engine = create_engine(
-        f"sqlite:///{db_path}",
+        "sqlite://",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
-    testing_session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # pysqlite 默认不显式 BEGIN，SAVEPOINT 隔离需要由 SQLAlchemy 自行管理事务。
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
-    session = testing_session()
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def run_async() -> Iterator[Callable[[Coroutine[Any, Any, Any]], Any]]:
+    # 整个测试会话复用一个事件循环，避免 asyncio.run 每次新建并关闭循环。
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.close()
+
+
+@pytest.fixture()
+def db_session(db_engine: Engine) -> Iterator[Session]:
+    # 表结构只建一次；每个用例在外层事务中运行，commit 只释放 SAVEPOINT，结束时整体回滚。
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(bind=engine)
-        engine.dispose()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture()
@@ -35,7 +73,7 @@ def make_task(db_session: Session) -> Callable[..., AITask]:
             "task_type": "process_ai_content",
             "content_type": "summary",
             "status": "pending",
-            "payload": "{}",
+            "payload": {},
             "attempts": 0,
             "max_attempts": 1,
             "run_at": now_str(),
@@ -44,8 +82,7 @@ def make_task(db_session: Session) -> Callable[..., AITask]:
         payload.update(overrides)
         task = AITask(**payload)
         db_session.add(task)
-        db_session.commit()
-        db_session.refresh(task)
+        db_session.flush()
         return task
 
     return _make_task
@@ -69,8 +106,7 @@ def make_task_event(
         payload.update(overrides)
         event = AITaskEvent(**payload)
         db_session.add(event)
-        db_session.commit()
-        db_session.refresh(event)
+        db_session.flush()
         return event
 
     return _make_task_event
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from app.api.routers import ai_tasks_router
+from app.schemas import AITaskRetryRequest
 from models import AITask, Article, ReviewIssue, ReviewTemplate
 
 
@@ -36,7 +37,7 @@ async def test_list_ai_tasks_prefers_translated_article_title(db_session):
         task_type="process_ai_content",
         content_type="summary",
         status="failed",
-        payload="{}",
+        payload={},
         attempts=1,
         max_attempts=3,
         run_at="2026-03-27T10:00:00",
@@ -88,7 +89,7 @@ async def test_list_ai_tasks_article_title_filter_matches_translated_title(db_se
         task_type="process_ai_content",
         content_type="summary",
         status="failed",
-        payload="{}",
+        payload={},
         attempts=1,
         max_attempts=3,
         run_at="2026-03-27T10:00:00",
@@ -140,7 +141,7 @@ async def test_get_ai_task_timeline_prefers_translated_article_title(db_session)
         task_type="process_ai_content",
         content_type="summary",
         status="failed",
-        payload="{}",
+        payload={},
         attempts=1,
         max_attempts=3,
         run_at="2026-03-27T10:00:00",
@@ -201,7 +202,7 @@ async def test_get_ai_task_prefers_translated_article_title_and_falls_back(db_se
         task_type="process_ai_content",
         content_type="summary",
         status="failed",
-        payload="{}",
+        payload={},
         attempts=1,
         max_attempts=3,
         run_at="2026-03-27T10:00:00",
@@ -214,7 +215,7 @@ async def test_get_ai_task_prefers_translated_article_title_and_falls_back(db_se
         task_type="process_ai_content",
         content_type="summary",
         status="failed",
-        payload="{}",
+        payload={},
         attempts=1,
         max_attempts=3,
         run_at="2026-03-27T11:00:00",
@@ -279,7 +280,7 @@ async def test_list_ai_tasks_returns_review_issue_target_for_review_generation_t
         task_type="generate_review_issue",
         content_type=None,
         status="completed",
-        payload=f'{{"issue_id":"{issue.id}","template_id":"{template.id}"}}',
+        payload={"issue_id": issue.id, "template_id": template.id},
         attempts=1,
         max_attempts=1,
         run_at="2026-04-04T10:01:00",
@@ -346,7 +347,7 @@ async def test_get_ai_task_timeline_returns_review_issue_target_for_review_gener
         task_type="generate_review_issue",
         content_type=None,
         status="completed",
-        payload=f'{{"issue_id":"{issue.id}","template_id":"{template.id}"}}',
+        payload={"issue_id": issue.id, "template_id": template.id},
         attempts=1,
         max_attempts=1,
         run_at="2026-04-04T10:01:00",
@@ -366,3 +367,44 @@ async def test_get_ai_task_timeline_returns_review_issue_target_for_review_gener
     assert response["task"]["article_title"] == issue.title
     assert response["task"]["article_slug"] == issue.slug
     assert response["task"]["article_kind"] == "review"
+
+
+@pytest.mark.anyio
+async def test_retry_ai_tasks_skips_tasks_with_active_duplicate(db_session, make_task):
+    active = make_task(status="pending", payload={"source": "manual"})
+    failed = make_task(status="failed", payload={"source": "manual"})
+    other = make_task(status="failed", payload={"source": "other"})
+
+    response = await ai_tasks_router.retry_ai_tasks(
+        AITaskRetryRequest(task_ids=[failed.id, other.id]),
+        db=db_session,
+        _=True,
+    )
+
+    assert response["updated_ids"] == [other.id]
+    assert response["skipped_ids"] == [failed.id]
+    assert response["skipped_reasons"][failed.id] == "存在活跃重复任务"
+    db_session.refresh(failed)
+    assert failed.status == "failed"
+    assert active.status == "pending"
+
+
+@pytest.mark.anyio
+async def test_retry_ai_tasks_dedupes_duplicates_within_one_batch(db_session, make_task):
+    first = make_task(status="failed", payload={"source": "manual"})
+    second = make_task(status="cancelled", payload={"source": "manual"})
+
+    response = await ai_tasks_router.retry_ai_tasks(
+        AITaskRetryRequest(task_ids=[first.id, second.id]),
+        db=db_session,
+        _=True,
+    )
+
+    assert response["updated_ids"] == [first.id]
+    assert response["skipped_ids"] == [second.id]
+    assert (
+        db_session.query(AITask)
+        .filter(AITask.status == "pending")
+        .count()
+        == 1
+    )
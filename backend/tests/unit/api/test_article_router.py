@@ -71,7 +71,7 @@ async def test_get_similar_articles_includes_translated_title(db_session, monkey
                 article_id=current_article.id,
                 model="test-model",
                 embedding="[1, 0]",
-                source_hash="expected-hash",
+                source_hash=b"expected-hash",
                 created_at=now_str(),
                 updated_at=now_str(),
             ),
@@ -79,7 +79,7 @@ async def test_get_similar_articles_includes_translated_title(db_session, monkey
                 article_id=similar_article.id,
                 model="test-model",
                 embedding="[1, 0]",
-                source_hash="candidate-hash",
+                source_hash=b"candidate-hash",
                 created_at=now_str(),
                 updated_at=now_str(),
             ),
@@ -105,7 +105,7 @@ async def test_get_similar_articles_includes_translated_title(db_session, monkey
     monkeypatch.setattr(
         article_router.article_embedding_service,
         "get_embedding_source_hash",
-        lambda article: "expected-hash",
+        lambda article: b"expected-hash",
     )
     monkeypatch.setattr(
         article_router.article_embedding_service,
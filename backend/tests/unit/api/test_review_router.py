@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import uuid
 
 import pytest
@@ -1068,8 +1067,8 @@ async def test_run_review_template_now_only_enqueues_selected_template(db_sessio
     tasks = db_session.query(AITask).filter(AITask.task_type == "generate_review_issue").all()
     assert len(tasks) == 1
     assert tasks[0].id == payload["task_id"]
-    assert target.id in tasks[0].payload
-    assert other.id not in tasks[0].payload
+    assert tasks[0].payload["template_id"] == target.id
+    assert other.id not in tasks[0].payload.values()
     target_issue = db_session.query(ReviewIssue).filter(ReviewIssue.template_id == target.id).one()
     assert target_issue.window_start == "2026-03-30T00:00:00+08:00"
     assert target_issue.window_end == "2026-04-06T00:00:00+08:00"
@@ -1203,7 +1202,7 @@ async def test_run_review_template_manual_enqueues_selected_articles_and_model_o
     assert issue.window_end == "2026-04-04T00:00:00+08:00"
 
     task = db_session.query(AITask).filter(AITask.id == payload["task_id"]).one()
-    task_payload = json.loads(task.payload)
+    task_payload = task.payload
     assert task_payload["template_id"] == template.id
     assert task_payload["issue_id"] == issue.id
     assert task_payload["article_ids"] == [second_article.id, first_article.id]
@@ -3,10 +3,13 @@ import uuid
 
 from alembic import command
 from alembic.config import Config
+import pytest
 from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
-from app.core.db_migrations import resolve_database_url
+from app.core import db_migrations
+from app.core.db_migrations import resolve_database_url, run_db_migrations
 from models import Base, PromptConfig, now_str
 
 
@@ -311,3 +314,352 @@ def test_ai_analysis_version_migration_backfills_existing_content(tmp_path):
     assert current_version_id
 
     engine.dispose()
+
+
+def test_embedding_source_hash_migration_switches_to_indexed_binary_digest(tmp_path):
+    db_path = tmp_path / "migration-embedding-source-hash.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE article_embeddings (
+                    id VARCHAR NOT NULL PRIMARY KEY,
+                    article_id VARCHAR NOT NULL UNIQUE,
+                    model VARCHAR,
+                    embedding TEXT NOT NULL,
+                    source_hash VARCHAR,
+                    created_at VARCHAR,
+                    updated_at VARCHAR
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO article_embeddings (id, article_id, model, embedding, source_hash)
+                VALUES ('embedding-1', 'article-1', 'test-model', '[1, 0]', 'deadbeef')
+                """
+            )
+        )
+
+    backend_dir = Path(__file__).resolve().parents[3]
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    config.attributes["database_url_override"] = f"sqlite:///{db_path}"
+    command.stamp(config, "20260410_0018")
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        column_type = conn.execute(
+            text(
+                "SELECT type FROM pragma_table_info('article_embeddings') "
+                "WHERE name = 'source_hash'"
+            )
+        ).scalar_one()
+        source_hash = conn.execute(
+            text("SELECT source_hash FROM article_embeddings WHERE id = 'embedding-1'")
+        ).scalar_one()
+        index_names = {
+            row[0]
+            for row in conn.execute(
+                text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = 'article_embeddings'"
+                )
+            )
+        }
+
+    assert column_type == "BLOB"
+    assert source_hash is None
+    assert "idx_article_embeddings_source_hash" in index_names
+
+    engine.dispose()
+
+
+def test_article_source_url_migration_replaces_unique_constraint_with_partial_index(
+    tmp_path,
+):
+    db_path = tmp_path / "migration-article-source-url.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE articles (
+                    id VARCHAR NOT NULL PRIMARY KEY,
+                    slug VARCHAR NOT NULL,
+                    source_url VARCHAR,
+                    created_at VARCHAR,
+                    UNIQUE (source_url)
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX idx_articles_created_at ON articles(created_at DESC)"
+            )
+        )
+        conn.execute(
+            text("CREATE INDEX idx_articles_source_url ON articles(source_url)")
+        )
+
+    backend_dir = Path(__file__).resolve().parents[3]
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    config.attributes["database_url_override"] = f"sqlite:///{db_path}"
+    command.stamp(config, "20261017_0019")
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        index_sql = dict(
+            conn.execute(
+                text(
+                    "SELECT name, sql FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = 'articles'"
+                )
+            ).fetchall()
+        )
+
+    assert "WHERE source_url IS NOT NULL" in index_sql["idx_articles_source_url_unique"]
+    assert "created_at DESC" in index_sql["idx_articles_created_at"]
+    assert "idx_articles_source_url" not in index_sql
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO articles (id, slug, source_url)
+                VALUES ('a1', 's1', NULL), ('a2', 's2', NULL), ('a3', 's3', 'https://x')
+                """
+            )
+        )
+    with pytest.raises(IntegrityError):
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO articles (id, slug, source_url) "
+                    "VALUES ('a4', 's4', 'https://x')"
+                )
+            )
+
+    engine.dispose()
+
+
+def test_run_db_migrations_skips_upgrade_when_database_is_at_head(tmp_path, monkeypatch):
+    database_url = f"sqlite:///{tmp_path / 'migration-at-head.db'}"
+    run_db_migrations(database_url)
+
+    upgrade_calls = []
+    monkeypatch.setattr(
+        db_migrations.command,
+        "upgrade",
+        lambda config, revision: upgrade_calls.append(revision),
+    )
+    run_db_migrations(database_url)
+
+    assert upgrade_calls == []
+
+
+def test_seed_default_prompts_migration_inserts_every_builtin_prompt(tmp_path):
+    db_path = tmp_path / "migration-seed-default-prompts.db"
+    database_url = f"sqlite:///{db_path}"
+    run_db_migrations(database_url)
+
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        seeded_types = {
+            row[0]
+            for row in conn.execute(
+                text(
+                    "SELECT type FROM prompt_configs "
+                    "WHERE category_id IS NULL AND is_default = 1"
+                )
+            )
+        }
+    engine.dispose()
+
+    assert {"summary", "key_points", "outline", "quotes", "translation"} <= seeded_types
+
+
+def test_failed_upgrade_rolls_back_every_revision_in_the_run(tmp_path):
+    db_path = tmp_path / "migration-atomic-upgrade.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE article_embeddings (
+                    id VARCHAR NOT NULL PRIMARY KEY,
+                    article_id VARCHAR NOT NULL UNIQUE,
+                    model VARCHAR,
+                    embedding TEXT NOT NULL,
+                    source_hash VARCHAR,
+                    created_at VARCHAR,
+                    updated_at VARCHAR
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO article_embeddings (id, article_id, model, embedding, source_hash)
+                VALUES ('embedding-1', 'article-1', 'test-model', '[1, 0]', 'deadbeef')
+                """
+            )
+        )
+        conn.execute(text("CREATE TABLE articles (id VARCHAR PRIMARY KEY, source_url VARCHAR)"))
+        conn.execute(
+            text(
+                """
+                INSERT INTO articles (id, source_url)
+                VALUES ('article-1', 'https://example.com/a'), ('article-2', 'https://example.com/a')
+                """
+            )
+        )
+
+    backend_dir = Path(__file__).resolve().parents[3]
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    config.attributes["database_url_override"] = f"sqlite:///{db_path}"
+    command.stamp(config, "20260410_0018")
+
+    with pytest.raises(IntegrityError):
+        command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        version = conn.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+        column_type = conn.execute(
+            text(
+                "SELECT type FROM pragma_table_info('article_embeddings') "
+                "WHERE name = 'source_hash'"
+            )
+        ).scalar_one()
+        source_hash = conn.execute(
+            text("SELECT source_hash FROM article_embeddings WHERE id = 'embedding-1'")
+        ).scalar_one()
+
+    assert version == "20260410_0018"
+    assert column_type == "VARCHAR"
+    assert source_hash == "deadbeef"
+
+    engine.dispose()
+
+
+def test_article_tags_migration_adds_tag_first_composite_index(tmp_path):
+    db_path = tmp_path / "migration-article-tags-index.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE article_tags (
+                    article_id VARCHAR NOT NULL,
+                    tag_id VARCHAR NOT NULL,
+                    PRIMARY KEY (article_id, tag_id)
+                )
+                """
+            )
+        )
+
+    backend_dir = Path(__file__).resolve().parents[3]
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    config.attributes["database_url_override"] = f"sqlite:///{db_path}"
+    command.stamp(config, "20261017_0020")
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        index_columns = [
+            row[0]
+            for row in conn.execute(
+                text(
+                    "SELECT name FROM pragma_index_info('idx_article_tags_tag_article') "
+                    "ORDER BY seqno"
+                )
+            ).fetchall()
+        ]
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT article_id FROM article_tags WHERE tag_id = 't1'")
+            ).fetchall()
+        )
+
+    assert index_columns == ["tag_id", "article_id"]
+    assert "idx_article_tags_tag_article" in plan
+
+    engine.dispose()
+
+
+def test_ai_tasks_migration_orders_claim_scan_by_index(tmp_path):
+    db_path = tmp_path / "migration-ai-tasks-claim-index.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE ai_tasks (
+                    id VARCHAR PRIMARY KEY,
+                    status VARCHAR,
+                    run_at VARCHAR,
+                    locked_at VARCHAR,
+                    created_at VARCHAR
+                )
+                """
+            )
+        )
+        conn.execute(
+            text("CREATE INDEX idx_ai_tasks_status_run_at ON ai_tasks (status, run_at)")
+        )
+
+    backend_dir = Path(__file__).resolve().parents[3]
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    config.attributes["database_url_override"] = f"sqlite:///{db_path}"
+    command.stamp(config, "20261017_0021")
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        index_names = {
+            row[0]
+            for row in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            ).fetchall()
+        }
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM ai_tasks "
+                    "WHERE status = :status AND run_at <= :now "
+                    "ORDER BY run_at, created_at LIMIT 1"
+                ),
+                {"status": "pending", "now": "2026-01-01T00:00:00"},
+            ).fetchall()
+        )
+
+    assert "idx_ai_tasks_status_run_at_created_at" in index_names
+    assert "idx_ai_tasks_status_run_at" not in index_names
+    assert "idx_ai_tasks_status_run_at_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+    engine.dispose()
@@ -75,3 +75,14 @@ def test_validate_startup_settings_rejects_invalid_app_public_base_url():
         validate_startup_settings(settings)
 
     assert "APP_PUBLIC_BASE_URL 必须以 http:// 或 https:// 开头" in str(exc_info.value)
+
+
+def test_validate_startup_settings_rejects_invalid_sqlite_cache_settings():
+    settings = make_settings(SQLITE_CACHE_SIZE_KB=0, SQLITE_MMAP_SIZE_MB=-1)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        validate_startup_settings(settings)
+
+    message = str(exc_info.value)
+    assert "SQLITE_CACHE_SIZE_KB 必须大于 0" in message
+    assert "SQLITE_MMAP_SIZE_MB 不能小于 0" in message
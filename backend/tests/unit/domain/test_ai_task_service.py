@@ -1,8 +1,8 @@
-import asyncio
-import json
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy import event, func, select, text
 
 import app.domain.ai_task_service as ai_task_module
 from app.domain.ai_task_service import AITaskService
@@ -10,12 +10,41 @@ from models import AITask, AITaskEvent
 from task_errors import TaskDataError
 
 
+# 固定的 ISO 时间戳：2025-12-31 为默认过期锁截止时间，2030-01-01 表示尚未到期的任务。
+T_2025_12_31 = "2025-12-31T00:00:00+00:00"
+T_2026_01_01 = "2026-01-01T00:00:00+00:00"
+T_2026_01_02 = "2026-01-02T00:00:00+00:00"
+T_2026_01_03 = "2026-01-03T00:00:00+00:00"
+T_2026_01_04 = "2026-01-04T00:00:00+00:00"
+T_2030_01_01 = "2030-01-01T00:00:00+00:00"
+
+
 class DummyPipeline:
     def __init__(self, current_task_id=None, enqueue_task_func=None):
         self.current_task_id = current_task_id
         self.enqueue_task_func = enqueue_task_func
 
 
+@pytest.fixture()
+def task_clock(monkeypatch):
+    def _set(now: str, stale_lock: str | None = None) -> None:
+        monkeypatch.setattr(ai_task_module, "get_now_iso", lambda: now)
+        if stale_lock is not None:
+            monkeypatch.setattr(ai_task_module, "get_stale_lock_iso", lambda: stale_lock)
+
+    return _set
+
+
+def count_task_events(db_session, task_id: str) -> dict[str, int]:
+    return dict(
+        db_session.execute(
+            select(AITaskEvent.event_type, func.count())
+            .where(AITaskEvent.task_id == task_id)
+            .group_by(AITaskEvent.event_type)
+        ).all()
+    )
+
+
 def test_enqueue_task_deduplicates_by_normalized_payload(db_session):
     service = AITaskService(worker_id="worker-test")
     first_id = service.enqueue_task(
@@ -36,30 +65,33 @@ def test_enqueue_task_deduplicates_by_normalized_payload(db_session):
     assert first_id == second_id
 
     task = db_session.query(AITask).one()
-    assert task.payload == '{"a":1,"b":2}'
+    assert task.payload == {"a": 1, "b": 2}
+    stored_payload = db_session.execute(
+        text("SELECT payload FROM ai_tasks WHERE id = :id"), {"id": task.id}
+    ).scalar_one()
+    assert stored_payload == '{"a":1,"b":2}'
 
     event = (
         db_session.query(AITaskEvent)
         .filter(AITaskEvent.task_id == first_id, AITaskEvent.event_type == "enqueued")
         .one()
     )
-    assert json.loads(event.details) == {
+    assert event.details == {
         "task_type": "process_ai_content",
         "content_type": "summary",
     }
 
 
-def test_claim_task_updates_status_lock_and_attempts(db_session, make_task, monkeypatch):
+def test_claim_task_updates_status_lock_and_attempts(db_session, make_task, task_clock):
     service = AITaskService(worker_id="worker-test")
     task = make_task(
         status="pending",
-        run_at="2026-01-01T00:00:00+00:00",
+        run_at=T_2026_01_01,
         locked_at=None,
         locked_by=None,
         attempts=0,
     )
-    monkeypatch.setattr(ai_task_module, "get_now_iso", lambda: "2026-01-02T00:00:00+00:00")
-    monkeypatch.setattr(ai_task_module, "get_stale_lock_iso", lambda: "2025-12-31T00:00:00+00:00")
+    task_clock(now=T_2026_01_02, stale_lock=T_2025_12_31)
 
     claimed = service.claim_task(db_session)
 
@@ -69,65 +101,92 @@ def test_claim_task_updates_status_lock_and_attempts(db_session, make_task, monk
     assert task.status == "processing"
     assert task.attempts == 1
     assert task.locked_by == "worker-test"
-    assert task.locked_at == "2026-01-02T00:00:00+00:00"
+    assert task.locked_at == T_2026_01_02
 
-    event_count = (
-        db_session.query(AITaskEvent)
-        .filter(AITaskEvent.task_id == task.id, AITaskEvent.event_type == "claimed")
-        .count()
+    assert count_task_events(db_session, task.id) == {"claimed": 1}
+
+
+def test_claim_task_returns_task_with_claimed_state_without_expiry(
+    db_session, make_task, task_clock
+):
+    service = AITaskService(worker_id="worker-test")
+    task = make_task(status="pending", run_at=T_2026_01_01, attempts=0)
+    task_clock(now=T_2026_01_02, stale_lock=T_2025_12_31)
+    # 与 SessionLocal 一致：提交后不过期对象，返回值必须已是领取后的状态。
+    db_session.expire_on_commit = False
+
+    claimed = service.claim_task(db_session)
+
+    assert claimed is task
+    assert claimed.status == "processing"
+    assert claimed.attempts == 1
+    assert claimed.locked_by == "worker-test"
+    assert claimed.locked_at == T_2026_01_02
+
+
+def test_claim_task_uses_clock_passed_by_worker(db_session, make_task):
+    service = AITaskService(worker_id="worker-test")
+    task = make_task(status="pending", run_at=T_2026_01_01, attempts=0)
+
+    claimed = service.claim_task(
+        db_session, now_iso=T_2026_01_02, stale_lock_iso=T_2025_12_31
     )
-    assert event_count == 1
 
+    assert claimed is task
+    assert claimed.locked_at == T_2026_01_02
+    assert claimed.updated_at == T_2026_01_02
 
-def test_claim_task_returns_none_when_no_pending_task_ready(db_session, make_task, monkeypatch):
+
+def test_get_poll_clock_derives_stale_lock_from_same_instant():
+    now_iso, stale_lock_iso = ai_task_module.get_poll_clock()
+
+    elapsed = datetime.fromisoformat(now_iso) - datetime.fromisoformat(stale_lock_iso)
+    assert elapsed == timedelta(seconds=ai_task_module.LOCK_TIMEOUT_SECONDS)
+
+
+def test_claim_task_returns_none_when_no_pending_task_ready(db_session, make_task, task_clock):
     service = AITaskService(worker_id="worker-test")
     make_task(
         status="pending",
-        run_at="2030-01-01T00:00:00+00:00",
+        run_at=T_2030_01_01,
     )
-    monkeypatch.setattr(ai_task_module, "get_now_iso", lambda: "2026-01-01T00:00:00+00:00")
-    monkeypatch.setattr(ai_task_module, "get_stale_lock_iso", lambda: "2025-12-31T00:00:00+00:00")
+    task_clock(now=T_2026_01_01, stale_lock=T_2025_12_31)
 
     claimed = service.claim_task(db_session)
 
     assert claimed is None
 
 
-def test_finish_task_marks_completed_and_writes_event(db_session, make_task, monkeypatch):
+def test_finish_task_marks_completed_and_writes_event(db_session, make_task, task_clock):
     service = AITaskService(worker_id="worker-test")
     task = make_task(
         status="processing",
         locked_by="worker-test",
-        locked_at="2026-01-01T00:00:00+00:00",
+        locked_at=T_2026_01_01,
     )
-    monkeypatch.setattr(ai_task_module, "get_now_iso", lambda: "2026-01-03T00:00:00+00:00")
+    task_clock(now=T_2026_01_03)
 
     service.finish_task(db_session, task, success=True)
 
     db_session.refresh(task)
     assert task.status == "completed"
-    assert task.finished_at == "2026-01-03T00:00:00+00:00"
+    assert task.finished_at == T_2026_01_03
     assert task.locked_at is None
     assert task.locked_by is None
     assert task.last_error is None
     assert task.last_error_type is None
 
-    event_count = (
-        db_session.query(AITaskEvent)
-        .filter(AITaskEvent.task_id == task.id, AITaskEvent.event_type == "completed")
-        .count()
-    )
-    assert event_count == 1
+    assert count_task_events(db_session, task.id) == {"completed": 1}
 
 
-def test_finish_task_marks_failed_and_preserves_error_metadata(db_session, make_task, monkeypatch):
+def test_finish_task_marks_failed_and_preserves_error_metadata(db_session, make_task, task_clock):
     service = AITaskService(worker_id="worker-test")
     task = make_task(
         status="processing",
         locked_by="worker-test",
-        locked_at="2026-01-01T00:00:00+00:00",
+        locked_at=T_2026_01_01,
     )
-    monkeypatch.setattr(ai_task_module, "get_now_iso", lambda: "2026-01-03T00:00:00+00:00")
+    task_clock(now=T_2026_01_03)
 
     service.finish_task(
         db_session,
@@ -140,7 +199,7 @@ def test_finish_task_marks_failed_and_preserves_error_metadata(db_session, make_
 
     db_session.refresh(task)
     assert task.status == "failed"
-    assert task.finished_at == "2026-01-03T00:00:00+00:00"
+    assert task.finished_at == T_2026_01_03
     assert task.last_error == "network timeout"
     assert task.last_error_type == "timeout"
 
@@ -151,7 +210,7 @@ def test_finish_task_marks_failed_and_preserves_error_metadata(db_session, make_
     )
     assert event.error_type == "timeout"
     assert event.message == "network timeout"
-    assert json.loads(event.details)["retryable"] is False
+    assert event.details["retryable"] is False
 
 
 def test_finish_task_ignores_processing_task_owned_by_other_worker(db_session, make_task):
@@ -159,7 +218,7 @@ def test_finish_task_ignores_processing_task_owned_by_other_worker(db_session, m
     task = make_task(
         status="processing",
         locked_by="worker-other",
-        locked_at="2026-01-01T00:00:00+00:00",
+        locked_at=T_2026_01_01,
     )
 
     service.finish_task(db_session, task, success=True)
@@ -167,18 +226,17 @@ def test_finish_task_ignores_processing_task_owned_by_other_worker(db_session, m
     db_session.refresh(task)
     assert task.status == "processing"
     assert task.locked_by == "worker-other"
-    assert db_session.query(AITaskEvent).filter(AITaskEvent.task_id == task.id).count() == 0
+    assert count_task_events(db_session, task.id) == {}
 
 
-def test_cleanup_stale_tasks_marks_timeout_failures(db_session, make_task, monkeypatch):
+def test_cleanup_stale_tasks_marks_timeout_failures(db_session, make_task, task_clock):
     service = AITaskService(worker_id="worker-test")
     task = make_task(
         status="processing",
         locked_by="worker-test",
-        locked_at="2026-01-01T00:00:00+00:00",
+        locked_at=T_2026_01_01,
     )
-    monkeypatch.setattr(ai_task_module, "get_now_iso", lambda: "2026-01-04T00:00:00+00:00")
-    monkeypatch.setattr(ai_task_module, "get_stale_lock_iso", lambda: "2026-01-02T00:00:00+00:00")
+    task_clock(now=T_2026_01_04, stale_lock=T_2026_01_02)
 
     cleaned = service.cleanup_stale_tasks(db_session)
 
@@ -188,14 +246,70 @@ def test_cleanup_stale_tasks_marks_timeout_failures(db_session, make_task, monke
     assert task.locked_at is None
     assert task.locked_by is None
     assert task.last_error_type == "timeout"
-    assert task.finished_at == "2026-01-04T00:00:00+00:00"
+    assert task.finished_at == T_2026_01_04
 
-    event_count = (
-        db_session.query(AITaskEvent)
-        .filter(AITaskEvent.task_id == task.id, AITaskEvent.event_type == "stale_lock_failed")
-        .count()
+    assert count_task_events(db_session, task.id) == {"stale_lock_failed": 1}
+
+
+def test_cleanup_stale_tasks_resets_only_stale_locks(db_session, make_task, task_clock):
+    service = AITaskService(worker_id="worker-test")
+    stale_tasks = [
+        make_task(
+            status="processing",
+            content_type=content_type,
+            locked_by="worker-other",
+            locked_at=T_2026_01_01,
+        )
+        for content_type in ("summary", "outline")
+    ]
+    fresh_task = make_task(
+        status="processing",
+        content_type="quotes",
+        locked_by="worker-other",
+        locked_at=T_2026_01_03,
     )
-    assert event_count == 1
+    task_clock(now=T_2026_01_04, stale_lock=T_2026_01_02)
+
+    cleaned = service.cleanup_stale_tasks(db_session)
+
+    assert cleaned == 2
+    for task in stale_tasks:
+        db_session.refresh(task)
+        assert task.status == "failed"
+        assert task.locked_by is None
+        assert count_task_events(db_session, task.id) == {"stale_lock_failed": 1}
+    db_session.refresh(fresh_task)
+    assert fresh_task.status == "processing"
+    assert fresh_task.locked_by == "worker-other"
+    assert count_task_events(db_session, fresh_task.id) == {}
+
+    # 再次清理时已重置的任务不会被重复计数或重复写事件。
+    assert service.cleanup_stale_tasks(db_session) == 0
+    for task in stale_tasks:
+        assert count_task_events(db_session, task.id) == {"stale_lock_failed": 1}
+
+
+def test_cleanup_stale_tasks_skips_write_when_nothing_is_stale(
+    db_session, make_task, task_clock
+):
+    service = AITaskService(worker_id="worker-test")
+    make_task(status="processing", locked_by="worker-other", locked_at=T_2026_01_03)
+    task_clock(now=T_2026_01_04, stale_lock=T_2026_01_02)
+    statements = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        cleaned = service.cleanup_stale_tasks(db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert cleaned == 0
+    assert statements
+    assert all(sql.lstrip().startswith("SELECT") for sql in statements)
 
 
 def test_require_article_id_raises_when_missing():
@@ -205,39 +319,40 @@ def test_require_article_id_raises_when_missing():
     assert service._require_article_id("article-1") == "article-1"
 
 
-def test_run_task_async_rejects_unknown_task_type(monkeypatch):
+def test_run_task_async_rejects_unknown_task_type(monkeypatch, run_async):
     service = AITaskService(worker_id="worker-test")
     monkeypatch.setattr(ai_task_module, "ArticleAIPipelineService", DummyPipeline)
-    task = AITask(task_type="unknown_task", article_id="article-1", payload="{}")
+    task = AITask(task_type="unknown_task", article_id="article-1", payload={})
 
     with pytest.raises(TaskDataError, match="未知任务类型"):
-        asyncio.run(service.run_task_async(task))
+        run_async(service.run_task_async(task))
 
 
-def test_run_task_async_rejects_ai_content_without_content_type(monkeypatch):
+def test_run_task_async_rejects_ai_content_without_content_type(monkeypatch, run_async):
     service = AITaskService(worker_id="worker-test")
     monkeypatch.setattr(ai_task_module, "ArticleAIPipelineService", DummyPipeline)
     task = AITask(
         task_type="process_ai_content",
         article_id="article-1",
         content_type=None,
-        payload="{}",
+        payload={},
     )
 
     with pytest.raises(TaskDataError, match="缺少内容类型"):
-        asyncio.run(service.run_task_async(task))
+        run_async(service.run_task_async(task))
 
 
-def test_run_task_async_rejects_missing_article_id(monkeypatch):
+@pytest.mark.parametrize("task_type", sorted(ai_task_module.ARTICLE_TASK_TYPES))
+def test_run_task_async_rejects_missing_article_id(monkeypatch, run_async, task_type):
     service = AITaskService(worker_id="worker-test")
     monkeypatch.setattr(ai_task_module, "ArticleAIPipelineService", DummyPipeline)
-    task = AITask(task_type="process_article_embedding", article_id=None, payload="{}")
+    task = AITask(task_type=task_type, article_id=None, payload={})
 
     with pytest.raises(TaskDataError, match="缺少文章ID"):
-        asyncio.run(service.run_task_async(task))
+        run_async(service.run_task_async(task))
 
 
-def test_run_task_async_routes_embedding_task_to_handler(monkeypatch):
+def test_run_task_async_routes_embedding_task_to_handler(monkeypatch, run_async):
     service = AITaskService(worker_id="worker-test")
     monkeypatch.setattr(ai_task_module, "ArticleAIPipelineService", DummyPipeline)
     handler = AsyncMock(return_value=None)
@@ -246,15 +361,15 @@ def test_run_task_async_routes_embedding_task_to_handler(monkeypatch):
         id="task-embedding-1",
         task_type="process_article_embedding",
         article_id="article-1",
-        payload="{}",
+        payload={},
     )
 
-    asyncio.run(service.run_task_async(task))
+    run_async(service.run_task_async(task))
 
     handler.assert_awaited_once_with("task-embedding-1", "article-1")
 
 
-def test_run_task_async_routes_review_generation_task_to_handler(monkeypatch):
+def test_run_task_async_routes_review_generation_task_to_handler(monkeypatch, run_async):
     service = AITaskService(worker_id="worker-test")
     monkeypatch.setattr(ai_task_module, "ArticleAIPipelineService", DummyPipeline)
     handler = AsyncMock(return_value=None)
@@ -263,10 +378,15 @@ def test_run_task_async_routes_review_generation_task_to_handler(monkeypatch):
         id="task-review-1",
         task_type="generate_review_issue",
         article_id=None,
-        payload='{"template_id":"template-1","issue_id":"issue-1","article_ids":["article-1"],"model_api_config_id":"model-1"}',
+        payload={
+            "template_id": "template-1",
+            "issue_id": "issue-1",
+            "article_ids": ["article-1"],
+            "model_api_config_id": "model-1",
+        },
     )
 
-    asyncio.run(service.run_task_async(task))
+    run_async(service.run_task_async(task))
 
     handler.assert_awaited_once_with(
         "task-review-1",
@@ -1,6 +1,8 @@
 import asyncio
 import uuid
 
+import pytest
+
 import app.domain.article_ai_pipeline_service as article_ai_pipeline_module
 from app.domain.article_ai_pipeline_service import ArticleAIPipelineService
 from models import (
@@ -14,19 +16,21 @@ from models import (
 )
 
 
-def test_detect_media_kind_supports_book_links():
-    service = ArticleAIPipelineService()
+@pytest.fixture(scope="module")
+def pipeline_service() -> ArticleAIPipelineService:
+    # 纯文本处理方法不依赖实例状态，模块内共享一个服务实例。
+    return ArticleAIPipelineService()
 
-    assert service._detect_media_kind("https://example.com/library/demo.pdf") == "book"
-    assert service._detect_media_kind("https://example.com/library/demo.epub") == "book"
-    assert service._detect_media_kind("https://example.com/library/demo.mobi") == "book"
 
+def test_detect_media_kind_supports_book_links(pipeline_service):
+    assert pipeline_service._detect_media_kind("https://example.com/library/demo.pdf") == "book"
+    assert pipeline_service._detect_media_kind("https://example.com/library/demo.epub") == "book"
+    assert pipeline_service._detect_media_kind("https://example.com/library/demo.mobi") == "book"
 
-def test_build_media_markdown_link_renders_book_marker():
-    service = ArticleAIPipelineService()
 
+def test_build_media_markdown_link_renders_book_marker(pipeline_service):
     assert (
-        service._build_media_markdown_link(
+        pipeline_service._build_media_markdown_link(
             "book",
             "https://example.com/library/demo.pdf",
             "深度学习导论",
@@ -35,11 +39,9 @@ def test_build_media_markdown_link_renders_book_marker():
     )
 
 
-def test_build_media_markdown_link_uses_book_default_title():
-    service = ArticleAIPipelineService()
-
+def test_build_media_markdown_link_uses_book_default_title(pipeline_service):
     assert (
-        service._build_media_markdown_link(
+        pipeline_service._build_media_markdown_link(
             "book",
             "https://example.com/library/demo.epub",
         )
@@ -47,30 +49,27 @@ def test_build_media_markdown_link_uses_book_default_title():
     )
 
 
-def test_merge_with_overlap_deduplicates_markdown_blocks():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_deduplicates_markdown_blocks(pipeline_service):
     existing = "# 标题\n\n第一段内容。\n\n## 第二节\n\n重复边界段落。"
     new_text = "## 第二节\n\n重复边界段落。\n\n第三段新内容。"
 
-    merged = service._merge_with_overlap(existing, new_text)
+    merged = pipeline_service._merge_with_overlap(existing, new_text)
 
     assert merged.count("## 第二节") == 1
     assert merged.count("重复边界段落。") == 1
     assert merged.endswith("第三段新内容。")
 
 
-def test_merge_with_overlap_deduplicates_lines_when_blocks_do_not_match():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_deduplicates_lines_when_blocks_do_not_match(pipeline_service):
     existing = "A\nB\nC\nD"
     new_text = "C\nD\nE\nF"
 
-    merged = service._merge_with_overlap(existing, new_text)
+    merged = pipeline_service._merge_with_overlap(existing, new_text)
 
     assert merged == "A\nB\nC\nD\n\nE\nF"
 
 
-def test_merge_with_overlap_deduplicates_similar_sentence_boundaries():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_deduplicates_similar_sentence_boundaries(pipeline_service):
     existing = (
         "前文介绍背景。我们认为这个方案可以显著降低重复率，并且能够保持 Markdown 结构完整。"
     )
@@ -79,47 +78,43 @@ def test_merge_with_overlap_deduplicates_similar_sentence_boundaries():
         "然后进入验证阶段。"
     )
 
-    merged = service._merge_with_overlap(existing, new_text)
+    merged = pipeline_service._merge_with_overlap(existing, new_text)
 
     assert merged.count("我们认为这个方案可以显著降低重复率") == 1
     assert merged.endswith("然后进入验证阶段。")
 
 
-def test_merge_with_overlap_keeps_non_overlapping_content():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_keeps_non_overlapping_content(pipeline_service):
     existing = "第一部分。"
     new_text = "完全不同的第二部分。"
 
-    merged = service._merge_with_overlap(existing, new_text)
+    merged = pipeline_service._merge_with_overlap(existing, new_text)
 
     assert merged == "第一部分。\n\n完全不同的第二部分。"
 
 
-def test_merge_with_overlap_skips_sentence_trim_when_fence_unclosed():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_skips_sentence_trim_when_fence_unclosed(pipeline_service):
     existing = "```python\n# 该函数用于加载配置并初始化上下文对象以便后续处理"
     new_text = "# 该函数用于加载配置并初始化上下文对象以便后续处理。然后执行下一步。"
 
-    merged = service._merge_with_overlap(existing, new_text)
+    merged = pipeline_service._merge_with_overlap(existing, new_text)
 
     assert merged == f"{existing}\n\n{new_text}"
     assert merged.count("该函数用于加载配置并初始化上下文对象以便后续处理") == 2
 
 
-def test_merge_with_overlap_supports_continue_round_deduplication():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_supports_continue_round_deduplication(pipeline_service):
     round_1 = "这是一段较长的第一段内容，用于模拟续写拼接时的重复边界。"
     round_2 = f"{round_1}随后输出第二段。"
 
-    merged = service._merge_with_overlap("", round_1)
-    merged = service._merge_with_overlap(merged, round_2)
+    merged = pipeline_service._merge_with_overlap("", round_1)
+    merged = pipeline_service._merge_with_overlap(merged, round_2)
 
     assert merged.count(round_1) == 1
     assert merged.endswith("随后输出第二段。")
 
 
-def test_merge_with_overlap_handles_mixed_punctuation_sentence_boundaries():
-    service = ArticleAIPipelineService()
+def test_merge_with_overlap_handles_mixed_punctuation_sentence_boundaries(pipeline_service):
     existing = (
         "这是第一句用于说明背景信息并引出上下文？"
         "这是第二句用于描述跨语言标点兼容能力并验证边界拼接稳定性。"
@@ -129,26 +124,22 @@ def test_merge_with_overlap_handles_mixed_punctuation_sentence_boundaries():
         "接下来是第三句继续展开说明！"
     )
 
-    merged = service._merge_with_overlap(existing, new_text)
+    merged = pipeline_service._merge_with_overlap(existing, new_text)
 
     assert merged.count("这是第二句用于描述跨语言标点兼容能力并验证边界拼接稳定性") == 1
     assert merged.endswith("接下来是第三句继续展开说明！")
 
 
-def test_build_continue_prompt_adds_boundary_dedup_instruction():
-    service = ArticleAIPipelineService()
-
-    prompt = service._build_continue_prompt("请翻译：{content}", "这是已输出内容")
+def test_build_continue_prompt_adds_boundary_dedup_instruction(pipeline_service):
+    prompt = pipeline_service._build_continue_prompt("请翻译：{content}", "这是已输出内容")
 
     assert "如果下一段与已输出末尾有重复，必须删除重复后再继续" in prompt
     assert "禁止复述上一段最后一句" in prompt
 
 
-def test_extract_title_text_handles_markdown_heading_and_quotes():
-    service = ArticleAIPipelineService()
-
-    assert service._extract_title_text('# "Hello World"') == "Hello World"
-    assert service._extract_title_text("**你好，世界**") == "你好，世界"
+def test_extract_title_text_handles_markdown_heading_and_quotes(pipeline_service):
+    assert pipeline_service._extract_title_text('# "Hello World"') == "Hello World"
+    assert pipeline_service._extract_title_text("**你好，世界**") == "你好，世界"
 
 
 def test_process_article_translation_also_updates_translated_title(
@@ -678,14 +669,12 @@ def test_process_ai_content_infographic_repairs_layout_overflow_once(
     assert persisted.error_message is None
 
 
-def test_get_prompt_output_contract_returns_structured_contracts():
-    service = ArticleAIPipelineService()
-
-    infographic = service._get_prompt_output_contract("infographic")
-    outline = service._get_prompt_output_contract("outline")
-    classification = service._get_prompt_output_contract("classification")
-    tagging = service._get_prompt_output_contract("tagging")
-    validation = service._get_prompt_output_contract("content_validation")
+def test_get_prompt_output_contract_returns_structured_contracts(pipeline_service):
+    infographic = pipeline_service._get_prompt_output_contract("infographic")
+    outline = pipeline_service._get_prompt_output_contract("outline")
+    classification = pipeline_service._get_prompt_output_contract("classification")
+    tagging = pipeline_service._get_prompt_output_contract("tagging")
+    validation = pipeline_service._get_prompt_output_contract("content_validation")
 
     assert infographic.mode == "html_text"
     assert infographic.response_format == "text"
@@ -205,7 +205,7 @@ def test_delete_ai_content_rejects_inflight_ai_task(db_session):
         task_type="process_ai_content",
         content_type="quotes",
         status="processing",
-        payload="{}",
+        payload={},
         run_at=now_str(),
         updated_at=now_str(),
     )
@@ -3,12 +3,13 @@ from __future__ import annotations
 import uuid
 from xml.sax.saxutils import escape
 
+import pytest
+
 from app.domain.article_query_service import ArticleQueryService
 from models import AIAnalysis, Article, ArticleComment, Category, Tag, now_str
 
 
-def make_article(
-    db_session,
+def build_article(
     *,
     title: str,
     published_at: str | None,
@@ -39,12 +40,20 @@ def make_article(
     )
     if tags:
         article.tags = list(tags)
-    db_session.add(article)
-    db_session.commit()
-    db_session.refresh(article)
     return article
 
 
+def make_articles(db_session, specs: list[dict]) -> list[Article]:
+    articles = [build_article(**spec) for spec in specs]
+    db_session.add_all(articles)
+    db_session.flush()
+    return articles
+
+
+def make_article(db_session, **spec) -> Article:
+    return make_articles(db_session, [spec])[0]
+
+
 def make_category(db_session, name: str, sort_order: int = 0) -> Category:
     category = Category(
         id=str(uuid.uuid4()),
@@ -53,8 +62,7 @@ def make_category(db_session, name: str, sort_order: int = 0) -> Category:
         created_at=now_str(),
     )
     db_session.add(category)
-    db_session.commit()
-    db_session.refresh(category)
+    db_session.flush()
     return category
 
 
@@ -67,8 +75,7 @@ def make_tag(db_session, name: str) -> Tag:
         updated_at=now_str(),
     )
     db_session.add(tag)
-    db_session.commit()
-    db_session.refresh(tag)
+    db_session.flush()
     return tag
 
 
@@ -90,8 +97,7 @@ def make_analysis(
         infographic_image_url=infographic_image_url,
     )
     db_session.add(analysis)
-    db_session.commit()
-    db_session.refresh(analysis)
+    db_session.flush()
     return analysis
 
 
@@ -113,24 +119,39 @@ def make_comment(
         updated_at=now_str(),
     )
     db_session.add(comment)
-    db_session.commit()
-    db_session.refresh(comment)
+    db_session.flush()
     return comment
 
 
-def test_get_articles_sort_by_published_desc_handles_mixed_date_formats(db_session):
+@pytest.mark.parametrize(
+    ("specs", "expected_titles"),
+    [
+        pytest.param(
+            [
+                ("older-published", "2025/5/14", "2026-02-24T12:00:00+00:00"),
+                ("newer-published", "2026-02-24", "2026-02-24T10:00:00+00:00"),
+            ],
+            ["newer-published", "older-published"],
+            id="mixed-date-formats",
+        ),
+        pytest.param(
+            [
+                ("invalid-published-date", "not-a-date", "2026-02-24T12:00:00+00:00"),
+                ("valid-published-date", "2026-02-20", "2026-02-24T08:00:00+00:00"),
+            ],
+            ["invalid-published-date", "valid-published-date"],
+            id="falls-back-to-created-at",
+        ),
+    ],
+)
+def test_get_articles_sort_by_published_desc(db_session, specs, expected_titles):
     service = ArticleQueryService()
-    make_article(
+    make_articles(
         db_session,
-        title="older-published",
-        published_at="2025/5/14",
-        created_at="2026-02-24T12:00:00+00:00",
-    )
-    make_article(
-        db_session,
-        title="newer-published",
-        published_at="2026-02-24",
-        created_at="2026-02-24T10:00:00+00:00",
+        [
+            {"title": title, "published_at": published_at, "created_at": created_at}
+            for title, published_at, created_at in specs
+        ],
     )
 
     articles, total = service.get_articles(
@@ -141,40 +162,8 @@ def test_get_articles_sort_by_published_desc_handles_mixed_date_formats(db_sessi
         is_admin=True,
     )
 
-    assert total == 2
-    assert [item.title for item in articles] == [
-        "newer-published",
-        "older-published",
-    ]
-
-
-def test_get_articles_sort_by_published_desc_falls_back_to_created_at(db_session):
-    service = ArticleQueryService()
-    make_article(
-        db_session,
-        title="invalid-published-date",
-        published_at="not-a-date",
-        created_at="2026-02-24T12:00:00+00:00",
-    )
-    make_article(
-        db_session,
-        title="valid-published-date",
-        published_at="2026-02-20",
-        created_at="2026-02-24T08:00:00+00:00",
-    )
-
-    articles, _ = service.get_articles(
-        db=db_session,
-        page=1,
-        size=10,
-        sort_by="published_at_desc",
-        is_admin=True,
-    )
-
-    assert [item.title for item in articles] == [
-        "invalid-published-date",
-        "valid-published-date",
-    ]
+    assert total == len(expected_titles)
+    assert [item.title for item in articles] == expected_titles
 
 
 def test_get_articles_include_view_count_and_public_comment_count(db_session):
@@ -207,55 +196,55 @@ def test_export_articles_by_filters_matches_list_conditions(db_session):
     target_category = make_category(db_session, name="目标分类", sort_order=1)
     other_category = make_category(db_session, name="其他分类", sort_order=2)
 
-    matched = make_article(
-        db_session,
-        title="matched-article",
-        published_at="2026-01-10",
-        created_at="2026-01-11T00:00:00+00:00",
-        category_id=target_category.id,
-        source_domain="example.com",
-        author="Alice，Bob",
-        is_visible=False,
-    )
-    make_article(
-        db_session,
-        title="wrong-category",
-        published_at="2026-01-10",
-        created_at="2026-01-11T00:00:00+00:00",
-        category_id=other_category.id,
-        source_domain="example.com",
-        author="Alice，Bob",
-        is_visible=False,
-    )
-    make_article(
-        db_session,
-        title="wrong-source-domain",
-        published_at="2026-01-10",
-        created_at="2026-01-11T00:00:00+00:00",
-        category_id=target_category.id,
-        source_domain="other.com",
-        author="Alice，Bob",
-        is_visible=False,
-    )
-    make_article(
-        db_session,
-        title="wrong-author",
-        published_at="2026-01-10",
-        created_at="2026-01-11T00:00:00+00:00",
-        category_id=target_category.id,
-        source_domain="example.com",
-        author="Carol",
-        is_visible=False,
-    )
-    make_article(
-        db_session,
-        title="outside-date-range",
-        published_at="2025-12-31",
-        created_at="2026-01-11T00:00:00+00:00",
-        category_id=target_category.id,
-        source_domain="example.com",
-        author="Alice，Bob",
-        is_visible=False,
+    matched, *_ = make_articles(
+        db_session,
+        [
+            {
+                "title": "matched-article",
+                "published_at": "2026-01-10",
+                "created_at": "2026-01-11T00:00:00+00:00",
+                "category_id": target_category.id,
+                "source_domain": "example.com",
+                "author": "Alice，Bob",
+                "is_visible": False,
+            },
+            {
+                "title": "wrong-category",
+                "published_at": "2026-01-10",
+                "created_at": "2026-01-11T00:00:00+00:00",
+                "category_id": other_category.id,
+                "source_domain": "example.com",
+                "author": "Alice，Bob",
+                "is_visible": False,
+            },
+            {
+                "title": "wrong-source-domain",
+                "published_at": "2026-01-10",
+                "created_at": "2026-01-11T00:00:00+00:00",
+                "category_id": target_category.id,
+                "source_domain": "other.com",
+                "author": "Alice，Bob",
+                "is_visible": False,
+            },
+            {
+                "title": "wrong-author",
+                "published_at": "2026-01-10",
+                "created_at": "2026-01-11T00:00:00+00:00",
+                "category_id": target_category.id,
+                "source_domain": "example.com",
+                "author": "Carol",
+                "is_visible": False,
+            },
+            {
+                "title": "outside-date-range",
+                "published_at": "2025-12-31",
+                "created_at": "2026-01-11T00:00:00+00:00",
+                "category_id": target_category.id,
+                "source_domain": "example.com",
+                "author": "Alice，Bob",
+                "is_visible": False,
+            },
+        ],
     )
 
     markdown = service.export_articles_by_filters(
@@ -686,3 +675,24 @@ def test_render_articles_rss_prefers_translated_title(db_session):
 
     assert "<title>译文标题</title>" in rss
     assert "<title>Original Title</title>" not in rss
+
+
+def test_get_article_by_slug_only_loads_body_columns_for_detail(db_session):
+    article = make_article(
+        db_session,
+        title="Deferred",
+        published_at=None,
+        created_at="2026-02-01T00:00:00+00:00",
+    )
+    slug = article.slug
+    db_session.expunge_all()
+    service = ArticleQueryService()
+
+    lean = service.get_article_by_slug(db_session, slug)
+    assert "content_md" not in lean.__dict__
+    assert "note_content" not in lean.__dict__
+
+    db_session.expunge_all()
+    detail = service.get_article_by_slug(db_session, slug, include_relations=True)
+    assert detail.__dict__["content_md"] == "Deferred-content"
+    assert "note_content" in detail.__dict__
@@ -104,6 +104,35 @@ def test_set_article_tags_upserts_and_cleans_orphans(db_session):
     assert db_session.query(Tag).count() == 1
 
 
+def test_set_article_tags_reuses_existing_tag_and_preserves_order(db_session):
+    service = ArticleTagService()
+    first = make_article(db_session, title="first")
+    second = make_article(db_session, title="second")
+    service.set_article_tags(
+        db_session,
+        first,
+        ["AI"],
+        manual_override=True,
+        tagging_status="completed",
+        source_hash="hash-1",
+    )
+    db_session.commit()
+
+    tags = service.set_article_tags(
+        db_session,
+        second,
+        ["工作流", "ai", "Agent"],
+        manual_override=True,
+        tagging_status="completed",
+        source_hash="hash-2",
+    )
+    db_session.commit()
+
+    assert [tag.normalized_name for tag in tags] == ["工作流", "ai", "agent"]
+    assert tags[1].name == "AI"
+    assert db_session.query(Tag).count() == 3
+
+
 def test_parse_tag_names_supports_json_and_line_fallback():
     service = ArticleTagService()
 
@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 
 import pytest
@@ -15,6 +14,22 @@ from app.domain.article_url_ingest_service import (
 from models import Article, now_str
 
 
+SAMPLE_ARTICLE_HTML = """
+<html>
+  <head>
+    <title>Test Title</title>
+    <meta property="og:image" content="/cover.jpg" />
+    <meta name="author" content="Lumina Bot" />
+    <meta property="article:published_time" content="2026-02-24T00:00:00Z" />
+  </head>
+  <body>
+    <article><h1>Article</h1><p>Hello world content.</p></article>
+  </body>
+</html>
+"""
+EMPTY_ARTICLE_HTML = "<html><body><script>1</script><style>p{}</style></body></html>"
+
+
 class StubArticleCommandService:
     def __init__(self):
         self.last_payload: dict | None = None
@@ -43,8 +58,14 @@ class StubArticleCommandService:
         )
         db.add(article)
         db.commit()
-        db.refresh(article)
-        return article.id
+        return article_id
+
+
+@pytest.fixture()
+def url_service() -> ArticleUrlIngestService:
+    service = ArticleUrlIngestService(article_command_service=StubArticleCommandService())
+    service._hostname_resolves_to_private = lambda hostname: False
+    return service
 
 
 def make_existing_article(db_session, source_url: str) -> Article:
@@ -61,38 +82,28 @@ def make_existing_article(db_session, source_url: str) -> Article:
         updated_at=now_str(),
     )
     db_session.add(article)
-    db_session.commit()
-    db_session.refresh(article)
+    db_session.flush()
     return article
 
 
-def test_report_by_url_creates_article_and_uses_redirect_url(db_session, monkeypatch):
-    command = StubArticleCommandService()
-    service = ArticleUrlIngestService(article_command_service=command)
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
+def test_report_by_url_creates_article_and_uses_redirect_url(
+    db_session,
+    monkeypatch,
+    url_service,
+    run_async,
+):
+    command = url_service.article_command_service
 
     async def fake_fetch(_url: str) -> URLFetchResult:
         return URLFetchResult(
             final_url="https://example.com/final-path",
-            html="""
-            <html>
-              <head>
-                <title>Test Title</title>
-                <meta property="og:image" content="/cover.jpg" />
-                <meta name="author" content="Lumina Bot" />
-                <meta property="article:published_time" content="2026-02-24T00:00:00Z" />
-              </head>
-              <body>
-                <article><h1>Article</h1><p>Hello world content.</p></article>
-              </body>
-            </html>
-            """,
+            html=SAMPLE_ARTICLE_HTML,
         )
 
-    monkeypatch.setattr(service, "_fetch_html_from_url", fake_fetch)
+    monkeypatch.setattr(url_service, "_fetch_html_from_url", fake_fetch)
 
-    result = asyncio.run(
-        service.report_by_url(
+    result = run_async(
+        url_service.report_by_url(
             db_session,
             url="https://example.com/start",
             is_visible=True,
@@ -113,10 +124,10 @@ def test_report_by_url_creates_article_and_uses_redirect_url(db_session, monkeyp
 def test_report_by_url_uses_first_image_in_primary_content_when_meta_missing(
     db_session,
     monkeypatch,
+    url_service,
+    run_async,
 ):
-    command = StubArticleCommandService()
-    service = ArticleUrlIngestService(article_command_service=command)
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
+    command = url_service.article_command_service
 
     async def fake_fetch(_url: str) -> URLFetchResult:
         return URLFetchResult(
@@ -138,10 +149,10 @@ def test_report_by_url_uses_first_image_in_primary_content_when_meta_missing(
             """,
         )
 
-    monkeypatch.setattr(service, "_fetch_html_from_url", fake_fetch)
+    monkeypatch.setattr(url_service, "_fetch_html_from_url", fake_fetch)
 
-    asyncio.run(
-        service.report_by_url(
+    run_async(
+        url_service.report_by_url(
             db_session,
             url="https://example.com/start",
             skip_ai_processing=True,
@@ -152,14 +163,16 @@ def test_report_by_url_uses_first_image_in_primary_content_when_meta_missing(
     assert command.last_payload["top_image"] == "https://example.com/content-cover.jpg"
 
 
-def test_report_by_url_returns_duplicate_when_source_url_exists(db_session, monkeypatch):
+def test_report_by_url_returns_duplicate_when_source_url_exists(
+    db_session,
+    url_service,
+    run_async,
+):
     existing = make_existing_article(db_session, "https://example.com/existing")
-    service = ArticleUrlIngestService(article_command_service=StubArticleCommandService())
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
 
     with pytest.raises(ArticleUrlIngestDuplicateError) as exc_info:
-        asyncio.run(
-            service.report_by_url(
+        run_async(
+            url_service.report_by_url(
                 db_session,
                 url="https://example.com/existing",
             )
@@ -180,16 +193,14 @@ def test_report_by_url_returns_duplicate_when_source_url_exists(db_session, monk
 )
 def test_report_by_url_rejects_invalid_and_private_urls(
     db_session,
-    monkeypatch,
+    url_service,
     url,
     expected_detail,
+    run_async,
 ):
-    service = ArticleUrlIngestService(article_command_service=StubArticleCommandService())
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
-
     with pytest.raises(ArticleUrlIngestBadRequestError) as exc_info:
-        asyncio.run(
-            service.report_by_url(
+        run_async(
+            url_service.report_by_url(
                 db_session,
                 url=url,
             )
@@ -198,18 +209,15 @@ def test_report_by_url_rejects_invalid_and_private_urls(
     assert expected_detail in exc_info.value.detail
 
 
-def test_report_by_url_rejects_non_html_content(db_session, monkeypatch):
-    service = ArticleUrlIngestService(article_command_service=StubArticleCommandService())
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
-
+def test_report_by_url_rejects_non_html_content(db_session, monkeypatch, url_service, run_async):
     async def fake_fetch(_url: str) -> URLFetchResult:
         raise ArticleUrlIngestContentTypeError("目标URL不是HTML页面")
 
-    monkeypatch.setattr(service, "_fetch_html_from_url", fake_fetch)
+    monkeypatch.setattr(url_service, "_fetch_html_from_url", fake_fetch)
 
     with pytest.raises(ArticleUrlIngestContentTypeError):
-        asyncio.run(
-            service.report_by_url(
+        run_async(
+            url_service.report_by_url(
                 db_session,
                 url="https://example.com/not-html",
             )
@@ -223,39 +231,39 @@ def test_report_by_url_rejects_non_html_content(db_session, monkeypatch):
         ArticleUrlIngestBadGatewayError("抓取失败: network"),
     ],
 )
-def test_report_by_url_propagates_timeout_and_network_errors(db_session, monkeypatch, error):
-    service = ArticleUrlIngestService(article_command_service=StubArticleCommandService())
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
-
+def test_report_by_url_propagates_timeout_and_network_errors(
+    db_session,
+    monkeypatch,
+    url_service,
+    error,
+    run_async,
+):
     async def fake_fetch(_url: str) -> URLFetchResult:
         raise error
 
-    monkeypatch.setattr(service, "_fetch_html_from_url", fake_fetch)
+    monkeypatch.setattr(url_service, "_fetch_html_from_url", fake_fetch)
 
     with pytest.raises(type(error)):
-        asyncio.run(
-            service.report_by_url(
+        run_async(
+            url_service.report_by_url(
                 db_session,
                 url="https://example.com/network",
             )
         )
 
 
-def test_report_by_url_rejects_empty_content(db_session, monkeypatch):
-    service = ArticleUrlIngestService(article_command_service=StubArticleCommandService())
-    monkeypatch.setattr(service, "_hostname_resolves_to_private", lambda hostname: False)
-
+def test_report_by_url_rejects_empty_content(db_session, monkeypatch, url_service, run_async):
     async def fake_fetch(_url: str) -> URLFetchResult:
         return URLFetchResult(
             final_url="https://example.com/empty",
-            html="<html><body><script>1</script><style>p{}</style></body></html>",
+            html=EMPTY_ARTICLE_HTML,
         )
 
-    monkeypatch.setattr(service, "_fetch_html_from_url", fake_fetch)
+    monkeypatch.setattr(url_service, "_fetch_html_from_url", fake_fetch)
 
     with pytest.raises(ArticleUrlIngestBadRequestError) as exc_info:
-        asyncio.run(
-            service.report_by_url(
+        run_async(
+            url_service.report_by_url(
                 db_session,
                 url="https://example.com/empty",
             )
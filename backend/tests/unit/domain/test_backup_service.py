@@ -5,6 +5,7 @@ import json
 import sqlite3
 import uuid
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -46,6 +47,17 @@ def _make_session(db_path: Path) -> tuple[Session, object]:
     return SessionLocal(), engine
 
 
+@pytest.fixture()
+def db_session(tmp_path: Path) -> Iterator[Session]:
+    # 备份会直接读取 SQLite 文件，覆盖共享的内存库夹具，使用真实落盘的数据库。
+    session, engine = _make_session(tmp_path / "unit-tests.db")
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
 def _write_media(media_root: Path, relative_path: str, content: bytes) -> Path:
     target = media_root / relative_path
     target.parent.mkdir(parents=True, exist_ok=True)
@@ -163,7 +175,7 @@ def _build_archive_fixture(db_session: Session, media_root: Path) -> dict[str, s
         task_type="process_ai_content",
         content_type="summary",
         status="completed",
-        payload="{}",
+        payload={},
         attempts=1,
         max_attempts=1,
         run_at=now_str(),
@@ -184,7 +196,7 @@ def _build_archive_fixture(db_session: Session, media_root: Path) -> dict[str, s
         article_id=article.id,
         model="embedding-test",
         embedding="[0.1, 0.2]",
-        source_hash="hash",
+        source_hash=b"hash",
         created_at=now_str(),
         updated_at=now_str(),
     )
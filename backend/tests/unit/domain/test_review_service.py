@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import date
 import uuid
 from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import event
 
 from app.domain.review_service import (
     REVIEW_ARTICLE_SECTIONS_PLACEHOLDER,
@@ -314,6 +316,52 @@ def test_collect_articles_filters_by_created_at_and_selected_categories(db_sessi
     assert [article.id for article in articles] == [matched.id]
 
 
+def test_collect_articles_loads_full_text_in_one_query_for_full_text_mode(db_session):
+    service = ReviewService()
+    category = make_category(db_session, "AI", 1)
+    template = make_template(
+        db_session,
+        schedule_type="weekly",
+        review_input_mode="full_text",
+    )
+    for index in range(3):
+        make_article(
+            db_session,
+            title=f"FullText{index}",
+            created_at=f"2026-04-0{index + 2}T08:00:00+08:00",
+            category_id=category.id,
+            summary=f"summary {index}",
+            content_md=f"article body {index}",
+        )
+    template_id = template.id
+    db_session.expunge_all()
+    template = db_session.get(ReviewTemplate, template_id)
+    statements = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        articles = service.collect_articles(
+            db_session,
+            template,
+            window_start="2026-04-01T00:00:00+08:00",
+            window_end="2026-04-08T00:00:00+08:00",
+        )
+        payload = service._build_generation_article_payload(
+            articles,
+            input_mode="full_text",
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(articles) == 3
+    assert all(f"article body {index}" in payload for index in range(3))
+    assert len([sql for sql in statements if sql.lstrip().startswith("SELECT")]) == 1
+
+
 def test_collect_articles_orders_by_category_sort_order_then_created_at_desc(db_session):
     service = ReviewService()
     later_category = make_category(
@@ -775,6 +823,20 @@ def test_publish_issue_promotes_canonical_slug_from_versioned_draft(db_session):
     )
 
 
+def test_build_issue_slug_skips_every_taken_version_suffix(db_session):
+    service = ReviewService()
+    template = make_template(db_session, schedule_type="weekly")
+    base_slug = "weekly-review-2026-04-07-w15"
+    for slug in (base_slug, f"{base_slug}-v2", f"{base_slug}-v3"):
+        issue = make_issue(db_session, template.id)
+        issue.slug = slug
+    db_session.commit()
+
+    slug = service._build_issue_slug(db_session, template, date(2026, 4, 7), "W15")
+
+    assert slug == f"{base_slug}-v4"
+
+
 def test_enqueue_due_review_tasks_renders_template_name_and_next_published_issue_number(db_session):
     service = ReviewService()
     template = make_template(
@@ -1606,3 +1668,36 @@ def test_generate_issue_logs_ai_usage_with_task_context(db_session, monkeypatch)
     assert usage_log.prompt_tokens == 120
     assert usage_log.completion_tokens == 60
     assert usage_log.total_tokens == 180
+
+
+def test_generate_issue_replaces_linked_articles_in_bulk(db_session, monkeypatch):
+    service = ReviewService()
+    category = make_category(db_session, "AI", 1)
+    template = make_template(db_session, schedule_type="weekly")
+    issue = make_issue(db_session, template.id)
+    first = make_article(
+        db_session,
+        title="First",
+        created_at="2026-04-08T08:00:00+08:00",
+        category_id=category.id,
+    )
+    second = make_article(
+        db_session,
+        title="Second",
+        created_at="2026-04-09T08:00:00+08:00",
+        category_id=category.id,
+    )
+
+    async def fake_markdown(db, **kwargs):
+        return "# 回顾"
+
+    monkeypatch.setattr(service, "generate_issue_markdown", fake_markdown)
+
+    asyncio.run(service.generate_issue(db_session, template.id, issue.id, article_ids=[first.id, second.id]))
+    asyncio.run(service.generate_issue(db_session, template.id, issue.id, article_ids=[second.id]))
+
+    links = db_session.query(ReviewIssueArticle).filter(ReviewIssueArticle.issue_id == issue.id).all()
+    assert [link.article_id for link in links] == [second.id]
+    assert links[0].id
+    assert links[0].category_sort_order == 1
+    assert [link.article_id for link in issue.articles] == [second.id]
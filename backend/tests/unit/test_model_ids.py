@@ -0,0 +1,43 @@
+import time
+import uuid
+
+from sqlalchemy import event
+
+from models import Category, generate_uuid
+
+
+def test_generate_uuid_returns_uuid7_hex():
+    value = generate_uuid()
+
+    parsed = uuid.UUID(hex=value)
+    assert len(value) == 32
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_generate_uuid_is_ordered_by_creation_time():
+    first = generate_uuid()
+    time.sleep(0.002)
+    second = generate_uuid()
+
+    assert first < second
+    assert int(first[:12], 16) <= time.time_ns() // 1_000_000
+
+
+def test_orm_flush_inserts_client_generated_ids_without_returning(db_session):
+    statements = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        db_session.add_all([Category(name=f"category-{index}") for index in range(3)])
+        db_session.flush()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    inserts = [sql for sql in statements if sql.startswith("INSERT")]
+    assert inserts
+    assert all("RETURNING" not in sql for sql in inserts)
@@ -1,3 +1,5 @@
+import pytest
+
 import worker
 
 
@@ -60,3 +62,19 @@ def test_wait_for_required_tables_waits_for_review_tables_by_default():
     )
 
     assert sleeps == [0.5]
+
+
+def test_compute_idle_delay_backs_off_exponentially_up_to_poll_interval():
+    delays = [
+        worker.compute_idle_delay(idle_polls, 3.0, base_delay=0.1, rand=lambda: 1.0)
+        for idle_polls in (1, 2, 3, 6, 100)
+    ]
+
+    assert delays == [0.1, 0.2, 0.4, 3.0, 3.0]
+
+
+def test_compute_idle_delay_applies_jitter_within_upper_half():
+    assert worker.compute_idle_delay(1, 3.0, base_delay=0.4, rand=lambda: 0.0) == 0.2
+    assert worker.compute_idle_delay(
+        1, 3.0, base_delay=0.4, rand=lambda: 0.5
+    ) == pytest.approx(0.3)
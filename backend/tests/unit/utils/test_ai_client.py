@@ -0,0 +1,36 @@
+from ai_client import LANGUAGE_DETECTION_SAMPLE_CHARS, is_english_content
+
+
+def test_is_english_content_detects_plain_english_text():
+    text = "This article explains how the scheduler batches background jobs efficiently."
+    assert is_english_content(text) is True
+
+
+def test_is_english_content_requires_enough_letters():
+    assert is_english_content("Short English note.") is False
+
+
+def test_is_english_content_rejects_chinese_text():
+    text = "这篇文章介绍了后台任务调度器如何高效地批量处理任务，并讨论了常见的性能问题与优化思路。" * 2
+    assert is_english_content(text) is False
+
+
+def test_is_english_content_ignores_markup_and_code():
+    text = (
+        "<p>这是一篇中文文章，主要讨论数据库索引的设计与取舍。</p>"
+        "```python\nprint('hello world from a long english code block')\n```"
+        "[an english link title](https://example.com/english/path)"
+    )
+    assert is_english_content(text) is False
+
+
+def test_is_english_content_rejects_mixed_text_with_many_han_chars():
+    text = ("English words mixed with some content " * 3) + ("中文内容" * 10)
+    assert is_english_content(text, threshold=0.5) is False
+
+
+def test_is_english_content_only_samples_leading_window():
+    leading = "这篇文章介绍了后台任务调度器如何高效地批量处理任务。" * 2000
+    trailing = "English appendix text that would otherwise dominate the ratio. " * 5000
+    assert len(leading) > LANGUAGE_DETECTION_SAMPLE_CHARS
+    assert is_english_content(leading + trailing) is False
@@ -8,37 +8,40 @@ from media_service import (
 )
 
 
-def test_normalize_media_kind_defaults_to_image():
-    assert _normalize_media_kind(None) == "image"
-
-
-def test_normalize_media_kind_accepts_book():
-    assert _normalize_media_kind("book") == "book"
+@pytest.mark.parametrize(
+    ("kind", "expected"),
+    [
+        (None, "image"),
+        ("book", "book"),
+    ],
+)
+def test_normalize_media_kind_accepts_supported_kinds(kind, expected):
+    assert _normalize_media_kind(kind) == expected
 
 
-def test_normalize_media_kind_rejects_unknown_kind():
+@pytest.mark.parametrize("kind", ["video", "audio"])
+def test_normalize_media_kind_rejects_unknown_kind(kind):
     with pytest.raises(HTTPException) as exc_info:
-        _normalize_media_kind("video")
+        _normalize_media_kind(kind)
 
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail == "仅支持 image 或 book 类型"
 
 
-def test_validate_book_content_supports_known_mime():
-    content_type, extension = _validate_book_content("application/pdf", "demo.bin")
-
-    assert content_type == "application/pdf"
-    assert extension == ".pdf"
-
-
-def test_validate_book_content_falls_back_to_extension():
-    content_type, extension = _validate_book_content(
-        "application/octet-stream",
-        "https://example.com/books/demo.epub",
-    )
-
-    assert content_type == "application/epub+zip"
-    assert extension == ".epub"
+@pytest.mark.parametrize(
+    ("content_type", "source", "expected"),
+    [
+        ("application/pdf", "demo.bin", ("application/pdf", ".pdf")),
+        (
+            "application/octet-stream",
+            "https://example.com/books/demo.epub",
+            ("application/epub+zip", ".epub"),
+        ),
+    ],
+    ids=["known-mime", "extension-fallback"],
+)
+def test_validate_book_content_resolves_type_and_extension(content_type, source, expected):
+    assert _validate_book_content(content_type, source) == expected
 
 
 def test_validate_book_content_rejects_unknown_types():
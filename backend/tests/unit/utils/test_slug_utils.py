@@ -31,6 +31,12 @@ def test_generate_article_slug_appends_uuid_prefix():
     assert full_slug.endswith("-550e8400")
 
 
+def test_generate_article_slug_uses_random_tail_of_time_ordered_id():
+    article_id = "0192a3b4c5d67e8f9a0b1c2d3e4f5a6b"
+    full_slug = generate_article_slug("测试文章", article_id)
+    assert full_slug.endswith("-3e4f5a6b")
+
+
 def test_extract_id_from_slug_handles_standard_and_edge_cases():
     assert extract_id_from_slug("shen-du-xue-xi-550e8400") == "550e8400"
     assert extract_id_from_slug("550e8400") == "550e8400"
@@ -43,3 +43,9 @@ def test_normalize_task_error_falls_back_to_external_error():
     assert isinstance(normalized, TaskExternalError)
     assert normalized.retryable is True
     assert normalized.error_type == "external"
+
+
+def test_normalize_task_error_matches_english_keywords_case_insensitively():
+    assert isinstance(normalize_task_error(Exception("Read TIMEOUT")), TaskTimeoutError)
+    assert isinstance(normalize_task_error(Exception("Model Disabled")), TaskConfigError)
+    assert isinstance(normalize_task_error(Exception("请求超时")), TaskTimeoutError)
@@ -1,10 +1,10 @@
-import json
-
 import pytest
+from sqlalchemy import event
 
 from models import AITaskEvent
 from task_state import (
     append_task_event,
+    append_task_events,
     can_transition_task_status,
     ensure_task_status_transition,
 )
@@ -49,4 +49,43 @@ def test_append_task_event_persists_event_with_json_details(db_session, make_tas
     assert event.from_status == "pending"
     assert event.to_status == "processing"
     assert event.message == "任务已领取"
-    assert json.loads(event.details) == {"attempts": 1, "worker_id": "worker-test"}
+    assert event.details == {"attempts": 1, "worker_id": "worker-test"}
+
+
+def test_append_task_events_flushes_batch_in_single_insert(db_session, make_task):
+    tasks = [make_task(content_type=content_type) for content_type in ("summary", "outline")]
+    statements = []
+    engine = db_session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        append_task_events(
+            db_session,
+            [
+                {
+                    "task_id": task.id,
+                    "event_type": "stale_lock_failed",
+                    "from_status": "processing",
+                    "to_status": "failed",
+                    "error_type": "timeout",
+                    "details": {"worker_id": "worker-test"},
+                }
+                for task in tasks
+            ],
+        )
+        db_session.flush()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    inserts = [sql for sql in statements if sql.startswith("INSERT INTO ai_task_events")]
+    assert len(inserts) == 1
+    events = (
+        db_session.query(AITaskEvent)
+        .filter(AITaskEvent.task_id.in_([task.id for task in tasks]))
+        .all()
+    )
+    assert sorted(item.task_id for item in events) == sorted(task.id for task in tasks)
+    assert all(item.details == {"worker_id": "worker-test"} for item in events)
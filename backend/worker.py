@@ -1,4 +1,5 @@
 import asyncio
+import random
 import time
 from collections.abc import Callable
 
@@ -15,6 +16,7 @@ REQUIRED_TASK_TABLES = (
     "review_issues",
     "review_issue_articles",
 )
+IDLE_POLL_BASE_DELAY = 0.1
 
 
 def get_database_table_names() -> set[str]:
@@ -52,11 +54,24 @@ def wait_for_required_tables(
         sleep(poll_interval)
 
 
+def compute_idle_delay(
+    idle_polls: int,
+    poll_interval: float,
+    *,
+    base_delay: float = IDLE_POLL_BASE_DELAY,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    # 空轮询按指数退避到 poll_interval，并加入抖动避免多个 worker 同步轮询。
+    exponent = min(max(idle_polls - 1, 0), 32)
+    delay = min(float(poll_interval), base_delay * (2**exponent))
+    return delay / 2 + rand() * delay / 2
+
+
 def main() -> None:
     settings = get_settings()
     validate_startup_settings(settings)
 
-    from app.domain.ai_task_service import AITaskService
+    from app.domain.ai_task_service import AITaskService, get_poll_clock
     from models import SessionLocal
 
     ai_worker = settings.ai_worker
@@ -65,36 +80,55 @@ def main() -> None:
     task_timeout_seconds = ai_worker.task_timeout
     wait_for_required_tables(poll_interval=max(float(poll_interval), 1.0))
 
-    while True:
-        if restore_lock_active(settings.database_url):
-            time.sleep(poll_interval)
-            continue
-        db = SessionLocal()
-        try:
-            task_service.cleanup_stale_tasks(db)
-            task = task_service.claim_task(db)
-            if not task:
+    # 整个 worker 生命周期复用同一个事件循环，避免每个任务重复创建和销毁。
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    idle_polls = 0
+    try:
+        while True:
+            if restore_lock_active(settings.database_url):
                 time.sleep(poll_interval)
                 continue
+            db = SessionLocal()
             try:
-                asyncio.run(
-                    asyncio.wait_for(
-                        task_service.run_task_async(task), timeout=task_timeout_seconds
-                    )
+                now_iso, stale_lock_iso = get_poll_clock()
+                task_service.cleanup_stale_tasks(
+                    db, now_iso=now_iso, stale_lock_iso=stale_lock_iso
                 )
-                task_service.finish_task(db, task, success=True)
-            except Exception as exc:
-                task_error = normalize_task_error(exc)
-                task_service.finish_task(
-                    db,
-                    task,
-                    success=False,
-                    error=task_error.message,
-                    error_type=task_error.error_type,
-                    retryable=task_error.retryable,
+                task = task_service.claim_task(
+                    db, now_iso=now_iso, stale_lock_iso=stale_lock_iso
                 )
+                if not task:
+                    idle_polls += 1
+                    time.sleep(compute_idle_delay(idle_polls, poll_interval))
+                    continue
+                idle_polls = 0
+                try:
+                    loop.run_until_complete(
+                        asyncio.wait_for(
+                            task_service.run_task_async(task), timeout=task_timeout_seconds
+                        )
+                    )
+                    task_service.finish_task(db, task, success=True)
+                except Exception as exc:
+                    task_error = normalize_task_error(exc)
+                    task_service.finish_task(
+                        db,
+                        task,
+                        success=False,
+                        error=task_error.message,
+                        error_type=task_error.error_type,
+                        retryable=task_error.retryable,
+                    )
+            finally:
+                db.close()
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
         finally:
-            db.close()
+            asyncio.set_event_loop(None)
+            loop.close()
 
 
 if __name__ == "__main__":